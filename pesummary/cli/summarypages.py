@@ -3,8 +3,6 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
 from pesummary.utils.utils import logger, gw_results_file
-import pesummary.core.cli.inputs
-import pesummary.gw.cli.inputs
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
@@ -51,7 +49,7 @@ class _CoreWebpageGeneration(object):
     """
     def __init__(self, inputs, colors="default"):
         from pesummary.core.webpage.main import _WebpageGeneration
-        key_data = inputs.grab_key_data_from_result_files()
+        key_data = inputs.key_data
         self.webpage_object = _WebpageGeneration(
             webdir=inputs.webdir, samples=inputs.samples, labels=inputs.labels,
             publication=inputs.publication, user=inputs.user, config=inputs.config,
@@ -73,7 +71,9 @@ class _CoreWebpageGeneration(object):
             mcmc_samples=inputs.mcmc_samples,
             external_hdf5_links=inputs.external_hdf5_links, key_data=key_data,
             existing_plot=inputs.existing_plot, disable_expert=inputs.disable_expert,
-            analytic_priors=inputs.analytic_prior_dict
+            analytic_priors=inputs.analytic_prior_dict,
+            multi_process=inputs.multi_process,
+            checkpoint=inputs.restart_from_checkpoint
         )
 
     def generate_webpages(self):
@@ -93,16 +93,32 @@ class _GWWebpageGeneration(object):
         colors that you wish to use to distinguish different result files
     """
     def __init__(self, inputs, colors="default"):
+        self.webpage_object = self.webpage_class(
+            **self._webpage_kwargs(inputs)
+        )
+
+    @property
+    def webpage_class(self):
         from pesummary.gw.webpage.main import _WebpageGeneration
-        key_data = inputs.grab_key_data_from_result_files()
-        self.webpage_object = _WebpageGeneration(
+        return _WebpageGeneration
+
+    @staticmethod
+    def _webpage_kwargs(inputs):
+        """Return the kwargs needed to initialize the webpage class
+
+        Parameters
+        ----------
+        inputs: argparse.Namespace
+            Namespace object containing the command line options
+        """
+        return dict(
             webdir=inputs.webdir, samples=inputs.samples, labels=inputs.labels,
             publication=inputs.publication, user=inputs.user, config=inputs.config,
             same_parameters=inputs.same_parameters, base_url=inputs.baseurl,
             file_versions=inputs.file_version, hdf5=inputs.hdf5, colors=inputs.colors,
             custom_plotting=inputs.custom_plotting, gracedb=inputs.gracedb,
             pepredicates_probs=inputs.pepredicates_probs,
-            approximant=inputs.approximant, key_data=key_data,
+            approximant=inputs.approximant, key_data=inputs.key_data,
             file_kwargs=inputs.file_kwargs, existing_labels=inputs.existing_labels,
             existing_config=inputs.existing_config,
             existing_file_version=inputs.existing_file_version,
@@ -124,17 +140,20 @@ class _GWWebpageGeneration(object):
             external_hdf5_links=inputs.external_hdf5_links,
             preliminary_pages=inputs.preliminary_pages,
             disable_expert=inputs.disable_expert,
-            analytic_priors=inputs.analytic_prior_dict
+            analytic_priors=inputs.analytic_prior_dict,
+            multi_process=inputs.multi_process,
+            checkpoint=inputs.restart_from_checkpoint
         )
 
     def generate_webpages(self):
-        """Generate all webpages within the Core module
+        """Generate all webpages within the GW module
         """
         self.webpage_object.generate_webpages()
 
 
-class _PublicGWWebpageGeneration(object):
-    """Class to generate all webpages for all result files with the GW module
+class _PublicGWWebpageGeneration(_GWWebpageGeneration):
+    """Class to generate all public webpages for all result files with the GW
+    module
 
     Parameters
     ----------
@@ -143,57 +162,21 @@ class _PublicGWWebpageGeneration(object):
     colors: list, optional
         colors that you wish to use to distinguish different result files
     """
-    def __init__(self, inputs, colors="default"):
+    @property
+    def webpage_class(self):
         from pesummary.gw.webpage.public import _PublicWebpageGeneration
-        key_data = inputs.grab_key_data_from_result_files()
-        self.webpage_object = _PublicWebpageGeneration(
-            webdir=inputs.webdir, samples=inputs.samples, labels=inputs.labels,
-            publication=inputs.publication, user=inputs.user, config=inputs.config,
-            same_parameters=inputs.same_parameters, base_url=inputs.baseurl,
-            file_versions=inputs.file_version, hdf5=inputs.hdf5, colors=inputs.colors,
-            custom_plotting=inputs.custom_plotting, gracedb=inputs.gracedb,
-            pepredicates_probs=inputs.pepredicates_probs,
-            approximant=inputs.approximant, key_data=key_data,
-            file_kwargs=inputs.file_kwargs, existing_labels=inputs.existing_labels,
-            existing_config=inputs.existing_config,
-            existing_file_version=inputs.existing_file_version,
-            existing_injection_data=inputs.existing_injection_data,
-            existing_samples=inputs.existing_samples,
-            existing_metafile=inputs.existing,
-            add_to_existing=inputs.add_to_existing,
-            existing_file_kwargs=inputs.existing_file_kwargs,
-            existing_weights=inputs.existing_weights,
-            result_files=inputs.result_files, notes=inputs.notes,
-            disable_comparison=inputs.disable_comparison,
-            disable_interactive=inputs.disable_interactive,
-            pastro_probs=inputs.pastro_probs, gwdata=inputs.gwdata,
-            publication_kwargs=inputs.publication_kwargs,
-            no_ligo_skymap=inputs.no_ligo_skymap,
-            psd=inputs.psd, priors=inputs.priors,
-            package_information=inputs.package_information,
-            mcmc_samples=inputs.mcmc_samples, existing_plot=inputs.existing_plot,
-            external_hdf5_links=inputs.external_hdf5_links,
-            preliminary_pages=inputs.preliminary_pages,
-            disable_expert=inputs.disable_expert,
-            analytic_priors=inputs.analytic_prior_dict
-        )
-
-    def generate_webpages(self):
-        """Generate all webpages within the Core module
-        """
-        self.webpage_object.generate_webpages()
+        return _PublicWebpageGeneration
 
 
 def main(
     args=None,
     _parser=None,
-    _core_input_cls=pesummary.core.cli.inputs.WebpagePlusPlottingPlusMetaFileInput,
-    _gw_input_cls=pesummary.gw.cli.inputs.WebpagePlusPlottingPlusMetaFileInput
+    _core_input_cls=None,
+    _gw_input_cls=None
 ):
     """Top level interface for `summarypages`
     """
     from pesummary.utils import history_dictionary
-    from .summaryplots import PlotGeneration
 
     if _parser is None:
         from pesummary.gw.cli.parser import ArgumentParser
@@ -201,7 +184,14 @@ def main(
         _parser.add_all_groups_to_parser()
 
     opts, unknown = _parser.parse_known_args(args=args)
+    # the input modules are only imported once the command line has been
+    # parsed. This prevents the slow plotting/file imports from delaying
+    # `summarypages --help`
+    import pesummary.core.cli.inputs
+    from .summaryplots import PlotGeneration
+
     _gw = False
+    _gw_results_file = gw_results_file(opts)
     if opts.restart_from_checkpoint:
         from pesummary import conf
         import os
@@ -219,7 +209,7 @@ def main(
         input_args = (opts,)
         input_kwargs = {"checkpoint": state}
     else:
-        if opts.gw or gw_results_file(opts):
+        if opts.gw or _gw_results_file:
             _gw = True
         input_args = (opts,)
         input_kwargs = {}
@@ -227,12 +217,21 @@ def main(
     if _gw:
         from pesummary.gw.file.meta_file import GWMetaFile
         from pesummary.gw.finish import GWFinishingTouches
+        if _gw_input_cls is None:
+            import pesummary.gw.cli.inputs
+            _gw_input_cls = (
+                pesummary.gw.cli.inputs.WebpagePlusPlottingPlusMetaFileInput
+            )
         input_cls = _gw_input_cls
         meta_file_cls = GWMetaFile
         finish_cls = GWFinishingTouches
     else:
         from pesummary.core.file.meta_file import MetaFile
         from pesummary.core.finish import FinishingTouches
+        if _core_input_cls is None:
+            _core_input_cls = (
+                pesummary.core.cli.inputs.WebpagePlusPlottingPlusMetaFileInput
+            )
         input_cls = _core_input_cls
         meta_file_cls = MetaFile
         finish_cls = FinishingTouches
@@ -245,7 +244,7 @@ def main(
         command_line=_parser.command_line
     )
     meta_file_cls(args, history=_history)
-    if gw_results_file(opts):
+    if _gw_results_file:
         kwargs = dict(ligo_skymap_PID=plotting_object.ligo_skymap_PID)
     else:
         kwargs = {}
@@ -2,14 +2,26 @@
 
 import re
 import copy
+import functools
 import os
 import ast
 import argparse
-import configparser
 import numpy as np
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
+# Split a 'key:value' string at the final colon. Keys may themselves contain
+# colons, e.g. channel names such as 'H1:GDS-CALIB_STRAIN'
+_KEY_VALUE_REGEX = re.compile(r"^(.*):([^:]*)$", re.DOTALL)
+# Character substitutions and patterns used when converting strings read from
+# a configuration file into python dictionaries and lists
+_DICT_FROM_STR_TABLE = str.maketrans({"'": None, '"': None, "=": ":"})
+_DICT_FROM_STR_REGEX = re.compile(r'([A-Za-z/\.0-9][^\[\],:"}]*)')
+_LIST_FROM_STR_TABLE = str.maketrans("", "", "'[]")
+_LIST_FROM_STR_REGEX = re.compile(r",\s*")
+# Configuration file values which are converted directly to python objects
+_SPECIAL_CONFIG_VALUES = {"true": True, "false": False, "none": None}
+
 
 class CheckFilesExistAction(argparse.Action):
     """Class to extend the argparse.Action to identify if files exist
@@ -19,23 +31,39 @@ class CheckFilesExistAction(argparse.Action):
         self.check_input(values)
 
     def check_input(self, value):
-        """Check that all files provided exist
+        """Check that all files provided exist. When multiple files are
+        provided, the checks are performed concurrently to reduce the number
+        of serial round-trips on network filesystems
 
         Parameters
         ----------
         value: str, list, dict
             data structure that you wish to check
         """
+        files = self._flatten(value)
+        if len(files) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+                _ = list(executor.map(self._is_file, files))
+        else:
+            for ff in files:
+                _ = self._is_file(ff)
+
+    def _flatten(self, value):
+        """Return a flat list of all files stored in a data structure
+
+        Parameters
+        ----------
+        value: str, list, dict
+            data structure that you wish to flatten
+        """
         if isinstance(value, list):
-            for ff in value:
-                _ = self.check_input(ff)
-        elif isinstance(value, str):
-            _ = self._is_file(value)
+            return [ff for _value in value for ff in self._flatten(_value)]
         elif isinstance(value, dict):
-            for _value in value.values():
-                _ = self.check_input(_value)
-        else:
-            _ = self._is_file(value)
+            return [
+                ff for _value in value.values() for ff in self._flatten(_value)
+            ]
+        return [value]
 
     def _is_file(self, ff):
         """Return True if the file exists else raise a FileNotFoundError
@@ -116,50 +144,100 @@ class DeprecatedStoreFalseAction(BaseDeprecatedAction):
         return cls._DeprecatedStoreFalseAction
 
 
+@functools.lru_cache(maxsize=32)
+def _read_config_file(path, mtime, size):
+    """Read a configuration file and return the (key, value) pairs stored in
+    each section. The modification time and size of the file are passed so
+    that the cached result is refreshed if the file is changed
+
+    Parameters
+    ----------
+    path: str
+        path to the configuration file
+    mtime: int
+        the time that the file was last modified in nanoseconds
+    size: int
+        size of the file in bytes
+    """
+    import configparser
+
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    config.read(path)
+    return tuple(
+        tuple(config.items(section)) for section in config.sections()
+    )
+
+
 class ConfigAction(argparse.Action):
     """Class to extend the argparse.Action to handle dictionaries as input
     """
     def __call__(self, parser, namespace, values, option_string=None):
         setattr(namespace, self.dest, values)
 
-        items = {}
-        config = configparser.ConfigParser()
-        config.optionxform = str
+        if values is None or not os.path.isfile(values):
+            return
+        import configparser
+
+        _stat = os.stat(values)
         try:
-            config.read(values)
-            sections = config.sections()
-            for section in sections:
-                for key, value in config.items(section):
-                    if value.lower() == "true":
-                        items[key] = True
-                    elif value.lower() == "false":
-                        items[key] = False
-                    elif value.lower() == "none":
-                        items[key] = None
-                    else:
-                        try:
-                            _type = getattr(
-                                parser, "_option_string_actions"
-                            )["--{}".format(key)].type
-                        except Exception:
-                            _type = None
-                        if ":" in value or "{" in value:
-                            try:
-                                items[key] = self.dict_from_str(value, dtype=_type)
-                            except Exception:
-                                items[key] = value
-                        elif "," in value or "[" in value:
-                            items[key] = self.list_from_str(value, _type)
-                        else:
-                            if _type is not None:
-                                items[key] = _type(value)
-                            else:
-                                items[key] = value
-        except Exception:
-            pass
-        for i in vars(namespace).keys():
-            if i in items.keys():
-                setattr(namespace, i, items[i])
+            _config = _read_config_file(
+                values, _stat.st_mtime_ns, _stat.st_size
+            )
+        except configparser.Error as e:
+            parser.error(
+                "Failed to parse config file {}: {}".format(values, e)
+            )
+        _actions = getattr(parser, "_option_string_actions")
+        _namespace = vars(namespace)
+        for section in _config:
+            for key, value in section:
+                if key not in _namespace:
+                    continue
+                if value.lower() in _SPECIAL_CONFIG_VALUES:
+                    _namespace[key] = _SPECIAL_CONFIG_VALUES[value.lower()]
+                    continue
+                _option = "--{}".format(key)
+                _type = _actions[_option].type if _option in _actions else None
+                if ":" in value or "{" in value:
+                    try:
+                        _namespace[key] = self.dict_from_str(value, dtype=_type)
+                    except Exception:
+                        _namespace[key] = value
+                elif "," in value or "[" in value:
+                    try:
+                        _namespace[key] = self.list_from_str(value, _type)
+                    except (ValueError, TypeError) as e:
+                        self._parse_error(parser, key, values, e)
+                elif _type is not None:
+                    try:
+                        _namespace[key] = _type(value)
+                    except (ValueError, TypeError) as e:
+                        self._parse_error(parser, key, values, e)
+                else:
+                    _namespace[key] = value
+
+    @staticmethod
+    def _parse_error(parser, key, config_file, error):
+        """Exit with a usage message because a value in the configuration
+        file could not be converted
+
+        Parameters
+        ----------
+        parser: argparse.ArgumentParser
+            the parser that is reading the configuration file
+        key: str
+            the option that could not be converted
+        config_file: str
+            path to the configuration file
+        error: Exception
+            the exception raised when converting the value
+        """
+        parser.error(
+            "Failed to parse '{}' in config file {}: {}".format(
+                key, config_file, error
+            )
+        )
 
     @staticmethod
     def dict_from_str(string, delimiter=":", dtype=None):
@@ -170,15 +248,14 @@ class ConfigAction(argparse.Action):
         string: str
             string that you would like reformatted into a dictionary
         """
-        string = string.replace("'", "")
-        string = string.replace('"', '')
-        string = string.replace("=", ":")
-        string = string.replace(delimiter, ":")
+        string = string.translate(_DICT_FROM_STR_TABLE)
+        if delimiter != ":":
+            string = string.replace(delimiter, ":")
         if "dict(" in string:
             string = string.replace("dict(", "{")
             string = string.replace(")", "}")
         string = string.replace(" ", "")
-        string = re.sub(r'([A-Za-z/\.0-9][^\[\],:"}]*)', r'"\g<1>"', string)
+        string = _DICT_FROM_STR_REGEX.sub(r'"\g<1>"', string)
         string = string.replace('""', '"')
         try:
             mydict = ast.literal_eval(string)
@@ -210,21 +287,14 @@ class ConfigAction(argparse.Action):
         string: str
             string that you would like reformatted into a list
         """
-        list = []
-        string = string.replace("'", "")
-        if "[" in string:
-            string = string.replace("[", "")
-        if "]" in string:
-            string = string.replace("]", "")
-        if ", " in string:
-            list = string.split(", ")
-        elif "," in string:
-            list = string.split(",")
+        string = string.translate(_LIST_FROM_STR_TABLE).strip()
+        if "," not in string:
+            values = [string] if len(string) else []
         else:
-            list = [string]
+            values = _LIST_FROM_STR_REGEX.split(string)
         if dtype is not None:
-            list = [dtype(_) for _ in list]
-        return list
+            values = [dtype(_) for _ in values]
+        return values
 
 
 class DictionaryAction(argparse.Action):
@@ -242,20 +312,17 @@ class DictionaryAction(argparse.Action):
         items = getattr(namespace, self.dest)
         items = copy.copy(items)
         for value in values:
-            value = value.split(':')
-            if len(value) > 2:
-                value = [":".join(value[:-1]), value[-1]]
-            if len(value) == 2:
-                if value[0] in items.keys():
-                    if not isinstance(items[value[0]], list):
-                        items[value[0]] = [items[value[0]]]
-                    items[value[0]].append(value[1])
-                else:
-                    items[value[0]] = value[1]
-            elif len(value) == 1:
-                items.append(value[0])
+            match = _KEY_VALUE_REGEX.match(value)
+            if match is None:
+                items.append(value)
+                continue
+            key, value = match.groups()
+            if key in items:
+                if not isinstance(items[key], list):
+                    items[key] = [items[key]]
+                items[key].append(value)
             else:
-                raise ValueError("Did not understand input")
+                items[key] = value
         setattr(namespace, self.dest, items)
 
 
@@ -288,9 +355,9 @@ class DelimiterSplitAction(argparse.Action):
                     "'{}' appears multiple times. Please choose a different "
                     "delimiter".format(delimiter)
                 )
-            if value[0] in items.keys() and not isinstance(items[value[0]], list):
-                items[value[0]] = [items[value[0]]]
-            if value[0] in items.keys():
+            if value[0] in items:
+                if not isinstance(items[value[0]], list):
+                    items[value[0]] = [items[value[0]]]
                 items[value[0]].append(value[1])
             elif len(value) == 1 and len(values) == 1:
                 items = [value[0]]
@@ -90,9 +90,13 @@ class _Input(object):
             All kwargs are passed to the `generate_all_posterior_samples`
             method
         """
+        _kwargs = {}
+        if compare:
+            _kwargs["labels"] = compare
         f = read_function(
             existing_file,
-            remove_nan_likelihood_samples=not keep_nan_likelihood_samples
+            remove_nan_likelihood_samples=not keep_nan_likelihood_samples,
+            **_kwargs
         )
         for ind, label in enumerate(f.labels):
             kwargs[label] = kwargs.copy()
@@ -1100,6 +1104,18 @@ class _Input(object):
 
     @hdf5_compression.setter
     def hdf5_compression(self, hdf5_compression):
+        if hdf5_compression is not None and str(hdf5_compression) != "lzf":
+            msg = (
+                "Invalid compression filter '{}'. The compression filter "
+                "must be either an integer between 0 and 9 or "
+                "'lzf'".format(hdf5_compression)
+            )
+            try:
+                hdf5_compression = int(hdf5_compression)
+            except ValueError:
+                raise InputError(msg)
+            if not 0 <= hdf5_compression <= 9:
+                raise InputError(msg)
         self._hdf5_compression = hdf5_compression
         if not self.hdf5 and hdf5_compression is not None:
             logger.warning(
@@ -2011,6 +2027,16 @@ class SamplesInput(BaseInput):
         params = list(set.intersection(*[set(l) for l in parameters]))
         return params
 
+    @property
+    def key_data(self):
+        """The mean, median, maxL and standard deviation for all parameters
+        for each result file. This is only calculated once and then shared
+        between the plotting, webpage and metafile stages
+        """
+        if getattr(self, "_key_data", None) is None:
+            self._key_data = self.grab_key_data_from_result_files()
+        return self._key_data
+
     def grab_key_data_from_result_files(self):
         """Grab the mean, median, maxL and standard deviation for all
         parameters for all each result file
@@ -2072,6 +2098,9 @@ class WebpageInput(SamplesInput):
         self.hdf5 = not self.opts.save_to_json
         self.external_hdf5_links = self.opts.external_hdf5_links
         self.file_kwargs["webpage_url"] = self.baseurl + "/home.html"
+        # calculate the key data before writing the checkpoint file so that
+        # it is not recalculated when restarting from checkpoint
+        self._key_data = self.key_data
         self.write_current_state()
 
     @property
@@ -468,12 +468,13 @@ class ArgumentParser(argparse.ArgumentParser):
             },
             "--hdf5_compression": {
                 "dest": "hdf5_compression",
-                "type": int,
+                "type": str,
                 "help": (
                     "compress each dataset with a particular compression "
-                    "filter. Filter must be integer between 0 and 9. Only "
-                    "applies to meta files stored in hdf5 format. Default, no "
-                    "compression applied"
+                    "filter. Filter must be either an integer between 0 and 9 "
+                    "(gzip compression level) or 'lzf' (faster, but only "
+                    "readable with h5py). Only applies to meta files stored "
+                    "in hdf5 format. Default, no compression applied"
                 ),
                 "key": "metafile",
             },
@@ -574,6 +575,7 @@ class ArgumentParser(argparse.ArgumentParser):
         import inspect
         if parser is None:
             parser = self
+        _arglists = {}
         for name, kwargs in options.items():
             _kwargs = self.fallback_options.copy()
             _kwargs.update(kwargs)
@@ -589,7 +591,9 @@ class ArgumentParser(argparse.ArgumentParser):
 
             action = _kwargs.get('action', None)
             action_class = self._registry_get('action', action, action)
-            arglist = inspect.getargspec(action_class).args
+            if action_class not in _arglists.keys():
+                _arglists[action_class] = inspect.getargspec(action_class).args
+            arglist = _arglists[action_class]
             keys = _kwargs.copy().keys()
             for key in keys:
                 if (key not in arglist) and (key != "action"):
@@ -609,10 +613,11 @@ class ArgumentParser(argparse.ArgumentParser):
             parser to use when adding additional options. Default self
         """
         _options = {}
+        pesummary_options = self.pesummary_options
         for option in options:
-            if option not in self.pesummary_options.keys():
+            if option not in pesummary_options.keys():
                 raise ValueError("Unknown option '{}'".format(option))
-            _options[option] = self.pesummary_options[option]
+            _options[option] = pesummary_options[option]
         return self.add_additional_options_to_parser(_options, parser=parser)
 
     @property
@@ -8,6 +8,26 @@ from pesummary.utils.dict import load_recursively, paths_to_key
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
 
+def _read_dataset(dataset):
+    """Return the contents of a h5py dataset. If the dataset is stored
+    contiguously and without compression, the file is memory mapped rather
+    than copying the full dataset into memory
+
+    Parameters
+    ----------
+    dataset: h5py._hl.dataset.Dataset
+        dataset you wish to read
+    """
+    offset = dataset.id.get_offset()
+    contiguous = dataset.chunks is None and getattr(dataset, "external", None) is None
+    if not contiguous or offset is None or not dataset.dtype.isnative:
+        return np.array(dataset)
+    return np.memmap(
+        dataset.file.filename, dtype=dataset.dtype, mode="c", offset=offset,
+        shape=dataset.shape
+    )
+
+
 def read_hdf5(path, **kwargs):
     """Grab the parameters and samples in a .hdf5 file
 
@@ -123,10 +143,12 @@ def _read_hdf5_with_h5py(
             ]
         else:
             parameters = copy.deepcopy(original_parameters)
-        samples = np.array(f[path_to_samples]["samples"])
+        samples = _read_dataset(f[path_to_samples]["samples"])
     elif isinstance(f[path_to_samples], h5py._hl.dataset.Dataset):
         parameters = list(f[path_to_samples].dtype.names)
-        samples = np.array(f[path_to_samples]).view((float, len(parameters))).tolist()
+        samples = _read_dataset(f[path_to_samples]).view(
+            (float, len(parameters))
+        ).tolist()
     if return_posterior_dataset:
         return parameters, samples, f[path_to_samples]
     f.close()
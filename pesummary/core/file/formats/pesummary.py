@@ -15,6 +15,74 @@ from pesummary.utils.decorators import deprecation
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
+# dtypes that python scalars of each numpy kind are converted to by np.array
+_DEFAULT_DTYPE_FOR_KIND = {
+    "b": np.bool_, "i": np.int64, "u": np.int64, "f": np.float64
+}
+
+
+def _structured_to_2d_array(data):
+    """Convert a structured array into a 2d array with one row per sample and
+    one column per field. This is equivalent to
+    `[np.array(j.tolist()) for j in data]` but performed in a single vectorized
+    operation
+
+    Parameters
+    ----------
+    data: np.ndarray, h5py._hl.dataset.Dataset
+        structured array that you wish to convert
+    """
+    from numpy.lib.recfunctions import structured_to_unstructured
+
+    data = np.asarray(data)
+    kinds = set(data.dtype[name].kind for name in data.dtype.names)
+    if not kinds.issubset(_DEFAULT_DTYPE_FOR_KIND.keys()):
+        return np.array(data.tolist())
+    dtype = np.result_type(*[_DEFAULT_DTYPE_FOR_KIND[kind] for kind in kinds])
+    # always copy so the returned samples do not reference a memory mapped file
+    return structured_to_unstructured(data, dtype=dtype, copy=True)
+
+
+def _parse_injection_value(value):
+    """Convert a single injection value stored in a PESummary file into its
+    python representation
+
+    Parameters
+    ----------
+    value: float, str, bytes, list, np.ndarray
+        the stored injection value
+    """
+    if isinstance(value, (list, np.ndarray)):
+        value = value[0]
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    if isinstance(value, str):
+        if value.lower() == "nan":
+            value = np.nan
+        elif value.lower() == "none":
+            value = None
+    return value
+
+
+def _parse_injection_values(parameters, values):
+    """Return a dictionary of injection values keyed by parameter
+
+    Parameters
+    ----------
+    parameters: list
+        list of parameters that have injection values
+    values: list, np.ndarray
+        the stored injection value for each parameter
+    """
+    if isinstance(values, np.ndarray) and values.ndim == 1:
+        if values.dtype.kind in ["b", "i", "u", "f"]:
+            # numeric values do not need to be parsed
+            return dict(zip(parameters, values))
+    return {
+        parameter: _parse_injection_value(value) for parameter, value in
+        zip(parameters, values)
+    }
+
 
 def write_pesummary(
     *args, cls=None, outdir="./", label=None, config=None, injection_data=None,
@@ -97,21 +165,20 @@ def write_pesummary(
         file_kwargs = {
             label: {"sampler": {}, "meta_data": {}} for label in labels
         }
-    elif not all(label in file_kwargs.keys() for label in labels):
+    elif not set(labels).issubset(file_kwargs):
         file_kwargs = {label: file_kwargs for label in labels}
 
     if file_versions is None or isinstance(file_versions, str):
         file_versions = {label: "No version information found" for label in labels}
-    elif not all(label in file_versions.keys() for label in labels):
+    elif not set(labels).issubset(file_versions):
         file_versions = {label: file_versions for label in labels}
 
     if injection_data is None:
         injection_data = {
-            label: {
-                param: float("nan") for param in samples[label].keys()
-            } for label in samples.keys()
+            label: dict.fromkeys(samples[label].keys(), float("nan"))
+            for label in samples.keys()
         }
-    elif not all(label in injection_data.keys() for label in labels):
+    elif not set(labels).issubset(injection_data):
         injection_data = {label: injection_data for label in labels}
 
     if config is None:
@@ -142,6 +209,10 @@ class PESummary(MultiAnalysisRead):
     remove_nan_likelihood_samples: Bool, optional
         if True, remove samples which have log_likelihood='nan'. Default True
 
+    labels: list, optional
+        list of analyses that you wish to load from the result file. Default
+        load all analyses
+
     Attributes
     ----------
     parameters: nd list
@@ -193,9 +264,12 @@ class PESummary(MultiAnalysisRead):
     write_config_to_file:
         write the config file stored in the result file to file
     """
-    def __init__(self, path_to_results_file, **kwargs):
+    def __init__(self, path_to_results_file, labels=None, **kwargs):
         super(PESummary, self).__init__(path_to_results_file, **kwargs)
-        self.load(self._grab_data_from_pesummary_file, **self.load_kwargs)
+        self.load(
+            self._grab_data_from_pesummary_file, labels=labels,
+            **self.load_kwargs
+        )
 
     @property
     def load_kwargs(self):
@@ -247,19 +321,49 @@ class PESummary(MultiAnalysisRead):
         return func_map[MultiAnalysisRead.extension_from_path(path)](path, **kwargs)
 
     @staticmethod
-    def _convert_hdf5_to_dict(dictionary, path="/"):
+    def _is_analysis_group(group, key):
+        """Return True if `key` points to the data for a single analysis.
+        External links are not followed
+
+        Parameters
+        ----------
+        group: h5py._hl.group.Group
+            group containing `key`
+        key: str
+            name of the object you wish to check
         """
+        if isinstance(group.get(key, getlink=True), h5py.ExternalLink):
+            return True
+        item = group[key]
+        return (
+            isinstance(item, h5py._hl.group.Group) and
+            "posterior_samples" in item.keys()
+        )
+
+    @staticmethod
+    def _convert_hdf5_to_dict(dictionary, path="/", labels=None, memmap=False):
         """
+        """
+        from pesummary.core.file.formats.hdf5 import _read_dataset
+
         mydict = {}
-        for key, item in dictionary[path].items():
+        for key in dictionary[path].keys():
+            if labels is not None and key not in labels:
+                if PESummary._is_analysis_group(dictionary[path], key):
+                    continue
+            item = dictionary[path][key]
             if isinstance(item, h5py._hl.dataset.Dataset):
                 _attrs = dict(item.attrs)
                 if len(_attrs):
                     mydict["{}_attrs".format(key)] = _attrs
-                mydict[key] = np.array(item)
+                if memmap and item.dtype.names is not None:
+                    mydict[key] = _read_dataset(item)
+                else:
+                    mydict[key] = np.array(item)
             elif isinstance(item, h5py._hl.group.Group):
                 mydict[key] = PESummary._convert_hdf5_to_dict(
-                    dictionary, path=path + key + "/")
+                    dictionary, path=path + key + "/", memmap=memmap
+                )
         return mydict
 
     @staticmethod
@@ -268,11 +372,11 @@ class PESummary(MultiAnalysisRead):
         """
         function = kwargs.get(
             "grab_data_from_dictionary", PESummary._grab_data_from_dictionary)
-        f = h5py.File(path, 'r')
-        data = PESummary._convert_hdf5_to_dict(f)
-        existing_data = function(data)
-        f.close()
-        return existing_data
+        with h5py.File(path, 'r') as f:
+            data = PESummary._convert_hdf5_to_dict(
+                f, labels=kwargs.get("labels", None), memmap=True
+            )
+        return function(data)
 
     @staticmethod
     def _grab_data_from_json_file(path, **kwargs):
@@ -280,6 +384,12 @@ class PESummary(MultiAnalysisRead):
             "grab_data_from_dictionary", PESummary._grab_data_from_dictionary)
         with open(path) as f:
             data = json.load(f)
+        labels = kwargs.get("labels", None)
+        if labels is not None:
+            data = {
+                key: item for key, item in data.items() if key in labels or
+                not isinstance(item, dict) or "posterior_samples" not in item
+            }
         return function(data)
 
     @staticmethod
@@ -314,21 +424,17 @@ class PESummary(MultiAnalysisRead):
                 chains = list(dataset.keys())
                 parameters = [j for j in dataset[chains[0]].dtype.names]
                 samples = [
-                    [np.array(j.tolist()) for j in dataset[chain]] for chain
-                    in chains
+                    _structured_to_2d_array(dataset[chain]) for chain in chains
                 ]
             else:
                 posterior_samples = data["posterior_samples"]
                 new_format = (h5py._hl.dataset.Dataset, np.ndarray)
                 if isinstance(posterior_samples, new_format):
                     parameters = [j for j in posterior_samples.dtype.names]
-                    samples = [np.array(j.tolist()) for j in posterior_samples]
+                    samples = _structured_to_2d_array(posterior_samples)
                 else:
-                    parameters = \
-                        posterior_samples["parameter_names"].copy()
-                    samples = [
-                        j for j in posterior_samples["samples"]
-                    ].copy()
+                    parameters = posterior_samples["parameter_names"]
+                    samples = list(posterior_samples["samples"])
                 if isinstance(parameters[0], bytes):
                     parameters = [
                         parameter.decode("utf-8") for parameter in parameters
@@ -338,26 +444,12 @@ class PESummary(MultiAnalysisRead):
                 old_format = (h5py._hl.group.Group, dict)
                 _injection_data = data["injection_data"]
                 if not isinstance(_injection_data, old_format):
-                    parameters = [j for j in _injection_data.dtype.names]
+                    _parameters = [j for j in _injection_data.dtype.names]
                     inj = np.array(_injection_data.tolist())
                 else:
-                    inj = data["injection_data"]["injection_values"].copy()
-
-                def parse_injection_value(_value):
-                    if isinstance(_value, (list, np.ndarray)):
-                        _value = _value[0]
-                    if isinstance(_value, bytes):
-                        _value = _value.decode("utf-8")
-                    if isinstance(_value, str):
-                        if _value.lower() == "nan":
-                            _value = np.nan
-                        elif _value.lower() == "none":
-                            _value = None
-                    return _value
-                inj_list.append({
-                    parameter: parse_injection_value(value)
-                    for parameter, value in zip(parameters, inj)
-                })
+                    _parameters = parameters
+                    inj = data["injection_data"]["injection_values"]
+                inj_list.append(_parse_injection_values(_parameters, inj))
             else:
                 inj_list.append({
                     parameter: np.nan for parameter in parameters
@@ -376,12 +468,9 @@ class PESummary(MultiAnalysisRead):
                 meta_data_list.append(_meta_data)
             else:
                 meta_data_list.append({"sampler": {}, "meta_data": {}})
-            if "weights" in parameters or b"weights" in parameters:
-                ind = (
-                    parameters.index("weights") if "weights" in parameters
-                    else parameters.index(b"weights")
-                )
-                weights_list.append(Array([sample[ind] for sample in samples]))
+            if "weights" in parameters:
+                ind = parameters.index("weights")
+                weights_list.append(Array(np.asarray(samples)[:, ind]))
             else:
                 weights_list.append(None)
             if "version" in data.keys():
@@ -402,10 +491,7 @@ class PESummary(MultiAnalysisRead):
         reversed_prior_dict = {}
         for label in labels:
             for key, item in prior_dict[label].items():
-                if key in reversed_prior_dict.keys():
-                    reversed_prior_dict[key][label] = item
-                else:
-                    reversed_prior_dict.update({key: {label: item}})
+                reversed_prior_dict.setdefault(key, {})[label] = item
         return {
             "parameters": parameter_list,
             "samples": sample_list,
@@ -462,13 +548,13 @@ class PESummary(MultiAnalysisRead):
             list of labels that you wish to check
         """
         if labels == "all":
-            labels = list(self.labels)
-        elif not all(label in self.labels for label in labels):
-            for label in labels:
-                if label not in self.labels:
-                    raise ValueError(
-                        "The label {} is not present in the file".format(label)
-                    )
+            return list(self.labels)
+        _labels = set(self.labels)
+        for label in labels:
+            if label not in _labels:
+                raise ValueError(
+                    "The label {} is not present in the file".format(label)
+                )
         return labels
 
     @staticmethod
@@ -501,9 +587,10 @@ class PESummary(MultiAnalysisRead):
                 "form of a dictionary with kwargs 'filenames'"
             )
         labels = self._labels_for_write(labels)
+        _indices = {label: num for num, label in enumerate(self.labels)}
         _files = {}
         for num, label in enumerate(labels):
-            ind = self.labels.index(label)
+            ind = _indices[label]
             if cls_properties is not None:
                 for prop in cls_properties:
                     try:
@@ -614,34 +701,19 @@ class PESummaryDeprecated(PESummary):
                 samples = [np.array(j).tolist() for j in posterior_samples]
             else:
                 parameters = \
-                    dictionary["posterior_samples"][label]["parameter_names"].copy()
+                    dictionary["posterior_samples"][label]["parameter_names"]
                 samples = [
                     np.array(j).tolist() for j in
                     dictionary["posterior_samples"][label]["samples"]
-                ].copy()
+                ]
                 if isinstance(parameters[0], bytes):
                     parameters = [
                         parameter.decode("utf-8") for parameter in parameters
                     ]
             parameter_list.append(parameters)
             if "injection_data" in dictionary.keys():
-                inj = dictionary["injection_data"][label]["injection_values"].copy()
-
-                def parse_injection_value(_value):
-                    if isinstance(_value, (list, np.ndarray)):
-                        _value = _value[0]
-                    if isinstance(_value, bytes):
-                        _value = _value.decode("utf-8")
-                    if isinstance(_value, str):
-                        if _value.lower() == "nan":
-                            _value = np.nan
-                        elif _value.lower() == "none":
-                            _value = None
-                    return _value
-                inj_list.append({
-                    parameter: parse_injection_value(value)
-                    for parameter, value in zip(parameters, inj)
-                })
+                inj = dictionary["injection_data"][label]["injection_values"]
+                inj_list.append(_parse_injection_values(parameters, inj))
             sample_list.append(samples)
             config = None
             if "config_file" in dictionary.keys():
@@ -651,12 +723,9 @@ class PESummaryDeprecated(PESummary):
                 meta_data_list.append(data[label])
             else:
                 meta_data_list.append({"sampler": {}, "meta_data": {}})
-            if "weights" in parameters or b"weights" in parameters:
-                ind = (
-                    parameters.index("weights") if "weights" in parameters
-                    else parameters.index(b"weights")
-                )
-                weights_list.append(Array([sample[ind] for sample in samples]))
+            if "weights" in parameters:
+                ind = parameters.index("weights")
+                weights_list.append(Array(np.asarray(samples)[:, ind]))
             else:
                 weights_list.append(None)
         if "version" in dictionary.keys():
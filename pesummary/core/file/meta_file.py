@@ -1,11 +1,13 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
 import inspect
+import math
 import os
 import numpy as np
 import json
 import copy
 from getpass import getuser
+import h5py
 import pandas as pd
 import pesummary
 from pesummary import __version__
@@ -33,25 +35,24 @@ def recursively_save_dictionary_to_hdf5_file(
         dictionary of data
     current_path: optional, str
         string to indicate the level to save the data in the hdf5 file
-    compression: int, optional
-        optional filter to apply for compression. If you do not want to
-        apply compression, compression = None. Default None.
+    compression: int/str, optional
+        optional filter to apply for compression. Either an integer between
+        0 and 9 for gzip compression or 'lzf' for the faster lzf filter. If
+        you do not want to apply compression, compression = None. Default
+        None.
     """
-    def _safe_create_hdf5_group(hdf5_file, key):
-        if key not in hdf5_file.keys():
-            hdf5_file.create_group(key)
     for key in extra_keys:
         if key in dictionary:
-            _safe_create_hdf5_group(hdf5_file=f, key=key)
+            f.require_group(key)
     if current_path is None:
         current_path = []
 
+    group = f["/" + "/".join(current_path)]
     for k, v in dictionary.items():
         if isinstance(v, pd.DataFrame):
             v = v.to_dict(orient="list")
         if isinstance(v, dict):
-            if k not in f["/" + "/".join(current_path)].keys():
-                f["/".join(current_path)].create_group(k)
+            group.require_group(k)
             path = current_path + [k]
             recursively_save_dictionary_to_hdf5_file(
                 f, v, path, extra_keys=extra_keys, compression=compression
@@ -63,12 +64,13 @@ def recursively_save_dictionary_to_hdf5_file(
                 attrs = {}
             create_hdf5_dataset(
                 key=k, value=v, hdf5_file=f, current_path=current_path,
-                compression=compression, attrs=attrs
+                compression=compression, attrs=attrs, group=group
             )
 
 
 def create_hdf5_dataset(
-    key, value, hdf5_file, current_path, compression=None, attrs={}
+    key, value, hdf5_file, current_path, compression=None, attrs={},
+    group=None
 ):
     """
     Create a hdf5 dataset in place
@@ -86,11 +88,17 @@ def create_hdf5_dataset(
         hdf5 file object
     current_path: str
         Current string withing the hdf5 file
-    compression: int, optional
-        optional filter to apply for compression. If you do not want to
-        apply compression, compression = None. Default None.
+    compression: int/str, optional
+        optional filter to apply for compression. Either an integer between
+        0 and 9 for gzip compression or 'lzf' for the faster lzf filter. If
+        you do not want to apply compression, compression = None. Default
+        None.
     attrs: dict, optional
         optional list of attributes to store alongside the dataset
+    group: h5py.Group, optional
+        the group at `current_path`. If provided, the dataset is created
+        directly in this group rather than looking up `current_path` in
+        `hdf5_file`
     """
     error_message = "Cannot process {}={} from list with type {} for hdf5"
     array_types = (list, pesummary.utils.samples_dict.Array, np.ndarray)
@@ -99,14 +107,12 @@ def create_hdf5_dataset(
     SOFTLINK = False
 
     if isinstance(value, array_types):
-        import math
-
         if not len(value):
             data = np.array([])
         elif isinstance(value[0], string_types):
             data = np.array(value, dtype="S")
         elif isinstance(value[0], array_types):
-            data = np.array(np.vstack(value))
+            data = np.vstack(value)
         elif isinstance(value[0], (tuple, np.record, np.recarray)):
             data = value
         elif all(isinstance(_value, (bool, np.bool_)) for _value in value):
@@ -118,19 +124,15 @@ def create_hdf5_dataset(
         elif math.isnan(value[0]):
             data = np.array(["NaN"] * len(value), dtype="S")
         elif isinstance(value[0], numeric_types):
-            data = np.array(value)
+            data = np.asarray(value)
         else:
             raise TypeError(error_message.format(key, value, type(value[0])))
     elif isinstance(value, string_types[0]) and "softlink:" in value:
-        import h5py
-
         SOFTLINK = True
         hdf5_file["/".join(current_path + [key])] = h5py.SoftLink(
             value.split("softlink:")[1]
         )
     elif isinstance(value, string_types[0]) and "external:" in value:
-        import h5py
-
         SOFTLINK = True
         substring = value.split("external:")[1]
         _file, _path = substring.split("|")
@@ -158,15 +160,27 @@ def create_hdf5_dataset(
         raise TypeError(error_message.format(key, value, type(value)))
     if not SOFTLINK:
         if compression is not None and len(data) > conf.compression_min_length:
-            kwargs = {"compression": "gzip", "compression_opts": compression}
+            # the shuffle filter groups together the bytes of each element
+            # which allows gzip and lzf to compress numeric data more
+            # efficiently
+            if compression == "lzf":
+                kwargs = {"compression": "lzf", "shuffle": True}
+            else:
+                kwargs = {
+                    "compression": "gzip", "compression_opts": compression,
+                    "shuffle": True
+                }
         else:
             kwargs = {}
-        try:
-            dset = hdf5_file["/".join(current_path)].create_dataset(
-                key, data=data, **kwargs
-            )
-        except ValueError:
-            dset = hdf5_file.create_dataset(key, data=data, **kwargs)
+        if group is not None:
+            dset = group.create_dataset(key, data=data, **kwargs)
+        else:
+            try:
+                dset = hdf5_file["/".join(current_path)].create_dataset(
+                    key, data=data, **kwargs
+                )
+            except ValueError:
+                dset = hdf5_file.create_dataset(key, data=data, **kwargs)
         if len(attrs):
             dset.attrs.update(attrs)
 
@@ -332,11 +346,12 @@ class _MetaFile(object):
                 dictionary["history"]["webpage_url"] = self.file_kwargs["webpage_url"]
             else:
                 dictionary["history"]["webpage_url"] = "None"
+        _configs = {}
         for num, label in enumerate(self.labels):
             parameters = self.samples[label].keys()
             samples = np.array([self.samples[label][i] for i in parameters]).T
             dictionary[label][posterior] = {
-                "parameter_names": list(parameters), "samples": samples.tolist()
+                "parameter_names": list(parameters), "samples": samples
             }
             dictionary[label]["injection_data"] = {
                 "parameters": list(parameters),
@@ -349,8 +364,12 @@ class _MetaFile(object):
             dictionary[label]["meta_data"] = self.file_kwargs[label]
             if self.config != {} and self.config[num] is not None and \
                     not isinstance(self.config[num], dict):
-                config = self._grab_config_data_from_data_file(self.config[num])
-                dictionary[label]["config_file"] = config
+                # analyses often share a config file so only parse it once
+                if self.config[num] not in _configs:
+                    _configs[self.config[num]] = (
+                        self._grab_config_data_from_data_file(self.config[num])
+                    )
+                dictionary[label]["config_file"] = _configs[self.config[num]]
             elif self.config[num] is not None:
                 dictionary[label]["config_file"] = self.config[num]
             for key in self.priors.keys():
@@ -378,11 +397,8 @@ class _MetaFile(object):
                     config.path_to_file, config.error
                 )
             )
-        if sections != []:
-            for i in sections:
-                data[i] = {}
-                for key in config["%s" % (i)]:
-                    data[i][key] = config["%s" % (i)]["%s" % (key)]
+        for i in sections:
+            data[i] = dict(config.items(i))
         return data
 
     @staticmethod
@@ -398,6 +414,15 @@ class _MetaFile(object):
         header: list, optional
             List of strings to write at the beginning of the file
         """
+        samples = np.asarray(samples)
+        if samples.ndim == 1 and len(samples):
+            # np.savetxt formats each row in a python loop. For a single
+            # column, tofile produces identical output in C
+            with open(file_name, "w") as f:
+                f.write(conf.delimiter.join(header) + "\n")
+                samples.tofile(f, sep="\n", format="%.18e")
+                f.write("\n")
+            return
         np.savetxt(
             file_name, samples, delimiter=conf.delimiter,
             header=conf.delimiter.join(header), comments=""
@@ -427,19 +452,18 @@ class _MetaFile(object):
         ... rec.array([(1., 1.), (2., 2.), (3., 3.)],
         ...           dtype=[('mass_1', '<f4'), ('mass_2', '<f4')])
         """
-        samples = copy.deepcopy(dictionary)
         if mcmc_samples:
-            parameters = list(samples.keys())
-            chains = samples[parameters[0]].keys()
+            parameters = list(dictionary.keys())
+            chains = dictionary[parameters[0]].keys()
             data = {
                 key: SamplesDict({
-                    param: samples[param][key] for param in parameters
+                    param: dictionary[param][key] for param in parameters
                 }) for key in chains
             }
             return {
                 key: item.to_structured_array() for key, item in data.items()
             }
-        return samples.to_structured_array(index=index)
+        return dictionary.to_structured_array(index=index)
 
     @staticmethod
     def _create_softlinks(dictionary):
@@ -452,36 +476,53 @@ class _MetaFile(object):
         dictionary: dict
             nested dictionary of data
         """
-        try:
-            from pandas.io.json._normalize import nested_to_record
-        except ImportError:
-            from pandas.io.json.normalize import nested_to_record
+        from functools import reduce
+        from operator import getitem
 
-        def modify_dict(key, dictionary, replace):
-            """
+        def _fingerprint(value):
+            """Return a hashable representation of an unhashable value
             """
-            from functools import reduce
-            from operator import getitem
+            if isinstance(value, np.ndarray):
+                # str(ndarray) truncates large arrays so compare the raw
+                # buffer instead
+                return (
+                    "ndarray", value.shape, value.dtype.str, value.tobytes()
+                )
+            return str(value)
 
-            mod = copy.deepcopy(dictionary)
-            key_list = key.split("/")
-            reduce(getitem, key_list[:-1], mod)[key_list[-1]] = replace
-            return mod
+        def _walk(nested, prefix=None):
+            """Yield the path and value of each leaf in a nested dictionary.
+            Top level leaves are yielded first to preserve the ordering of
+            pandas' nested_to_record
+            """
+            groups = []
+            for key, value in nested.items():
+                path = str(key) if prefix is None else "{}/{}".format(
+                    prefix, key
+                )
+                if not isinstance(value, dict):
+                    yield path, value
+                elif prefix is None:
+                    groups.append((path, value))
+                else:
+                    yield from _walk(value, prefix=path)
+            for path, value in groups:
+                yield from _walk(value, prefix=path)
 
         data = copy.deepcopy(dictionary)
-        flat_dictionary = nested_to_record(data, sep='/')
         rev_dictionary = {}
-        for key, value in flat_dictionary.items():
+        for key, value in _walk(data):
             try:
-                rev_dictionary.setdefault(value, set()).add(key)
+                rev_dictionary.setdefault(value, []).append(key)
             except TypeError:
-                rev_dictionary.setdefault(str(value), set()).add(key)
+                rev_dictionary.setdefault(_fingerprint(value), []).append(key)
 
         for key, values in rev_dictionary.items():
-            if len(values) > 1:
-                tmp = list(values)
-                for val in tmp[1:]:
-                    data = modify_dict(val, data, "softlink:/{}".format(tmp[0]))
+            for val in values[1:]:
+                key_list = val.split("/")
+                reduce(getitem, key_list[:-1], data)[key_list[-1]] = (
+                    "softlink:/{}".format(values[0])
+                )
         return data
 
     def write_marginalized_posterior_to_dat(self):
@@ -500,14 +541,26 @@ class _MetaFile(object):
                 )
 
     @staticmethod
-    def save_to_json(data, meta_file):
+    def save_to_json(data, meta_file, indent=None):
         """Save the metafile as a json file
+
+        Parameters
+        ----------
+        data: dict
+            dictionary of data to save
+        meta_file: str
+            name of the file you wish to write to
+        indent: int, optional
+            indent level to use when pretty printing the json file. Default
+            None, the file is written without indentation
         """
+        # json.dumps uses the C encoder when no indent is requested while
+        # json.dump always falls back to the pure python encoder
+        _data = json.dumps(
+            data, indent=indent, sort_keys=True, cls=PESummaryJsonEncoder
+        )
         with open(meta_file, "w") as f:
-            json.dump(
-                data, f, indent=4, sort_keys=True,
-                cls=PESummaryJsonEncoder
-            )
+            f.write(_data)
 
     @staticmethod
     def _seperate_dictionary_for_external_links(
@@ -573,8 +626,6 @@ class _MetaFile(object):
     ):
         """Save the metafile as a hdf5 file
         """
-        import h5py
-
         if _class is None:
             _class = _MetaFile
         if mcmc_samples:
@@ -656,7 +707,7 @@ class _MetaFile(object):
         """
         from pesummary.utils.utils import _add_existing_data
 
-        self = _add_existing_data(self)
+        _add_existing_data(self)
 
 
 class MetaFile(object):
@@ -5,37 +5,74 @@ from pesummary.core.file.formats.bilby import Bilby
 from pesummary.core.file.formats.default import Default
 from pesummary.core.file.formats.pesummary import PESummary, PESummaryDeprecated
 from pesummary.utils.utils import logger
+import collections
+import contextlib
+import json
 import os
+import h5py
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
 
+@contextlib.contextmanager
+def _open_hdf5_file(path):
+    """Open a hdf5 file for reading. If an open h5py.File object is passed,
+    it is returned unchanged and left open
+
+    Parameters
+    ----------
+    path: str, h5py.File
+        path to the results file or an open h5py.File object
+    """
+    if isinstance(path, h5py.File):
+        yield path
+    else:
+        with h5py.File(path, "r") as f:
+            yield f
+
+
+@contextlib.contextmanager
+def _open_json_file(path):
+    """Load the contents of a json file. If the contents have already been
+    loaded, they are returned unchanged
+
+    Parameters
+    ----------
+    path: str, dict
+        path to the results file or the already loaded contents of the file
+    """
+    if isinstance(path, (str, bytes, os.PathLike)):
+        with open(path, "r") as f:
+            yield json.load(f)
+    else:
+        yield path
+
+
 def is_bilby_hdf5_file(path):
     """Determine if the results file is a bilby hdf5 results file
 
     Parameters
     ----------
-    path: str
-        path to the results file
+    path: str, h5py.File
+        path to the results file or an open h5py.File object
     """
-    import h5py
     try:
-        f = h5py.File(path, "r")
-        if "bilby" in f["version"]:
-            return True
-        elif "bilby" in str(f["version"][0]):
-            return True
-        return False
-    except (KeyError, TypeError):
-        try:
-            if "bilby" in f["meta_data"]["loaded_modules"].keys():
-                return True
-            return False
-        except Exception:
-            return False
+        with _open_hdf5_file(path) as f:
+            try:
+                if "bilby" in f["version"]:
+                    return True
+                elif "bilby" in str(f["version"][0]):
+                    return True
+                return False
+            except (KeyError, TypeError):
+                try:
+                    if "bilby" in f["meta_data"]["loaded_modules"].keys():
+                        return True
+                    return False
+                except Exception:
+                    return False
     except Exception:
         return False
-    return False
 
 
 def is_bilby_json_file(path):
@@ -43,21 +80,19 @@ def is_bilby_json_file(path):
 
     Parameters
     ----------
-    path: str
-        path to the results file
+    path: str, dict
+        path to the results file or the already loaded contents of the file
     """
-    import json
-    with open(path, "r") as f:
-        data = json.load(f)
-    try:
-        if "bilby" in data["version"]:
-            return True
-        elif "bilby" in data["version"][0]:
-            return True
-        else:
+    with _open_json_file(path) as data:
+        try:
+            if "bilby" in data["version"]:
+                return True
+            elif "bilby" in data["version"][0]:
+                return True
+            else:
+                return False
+        except Exception:
             return False
-    except Exception:
-        return False
 
 
 def _is_pesummary_hdf5_file(path, check_function):
@@ -65,15 +100,13 @@ def _is_pesummary_hdf5_file(path, check_function):
 
     Parameters
     ----------
-    path: str
-        path to the results file
+    path: str, h5py.File
+        path to the results file or an open h5py.File object
     check_function: func
         function used to check the result file
     """
-    import h5py
-    f = h5py.File(path, 'r')
-    outcome = check_function(f)
-    f.close()
+    with _open_hdf5_file(path) as f:
+        outcome = check_function(f)
     return outcome
 
 
@@ -82,8 +115,8 @@ def is_pesummary_hdf5_file_deprecated(path):
 
     Parameters
     ----------
-    path: str
-        path to the results file
+    path: str, h5py.File
+        path to the results file or an open h5py.File object
     """
     return _is_pesummary_hdf5_file(path, _check_pesummary_file_deprecated)
 
@@ -93,8 +126,8 @@ def is_pesummary_hdf5_file(path):
 
     Parameters
     ----------
-    path: str
-        path to the results file
+    path: str, h5py.File
+        path to the results file or an open h5py.File object
     """
     return _is_pesummary_hdf5_file(path, _check_pesummary_file)
 
@@ -104,15 +137,14 @@ def _is_pesummary_json_file(path, check_function):
 
     Parameters
     ----------
-    path: str
-        path to the results file
+    path: str, dict
+        path to the results file or the already loaded contents of the file
     check_function: func
         function used to check the result file
     """
-    import json
-    with open(path, "r") as f:
-        data = json.load(f)
-    return check_function(data)
+    with _open_json_file(path) as data:
+        outcome = check_function(data)
+    return outcome
 
 
 def is_pesummary_json_file(path):
@@ -120,8 +152,8 @@ def is_pesummary_json_file(path):
 
     Parameters
     ----------
-    path: str
-        path to results file
+    path: str, dict
+        path to results file or the already loaded contents of the file
     """
     return _is_pesummary_json_file(path, _check_pesummary_file)
 
@@ -131,8 +163,8 @@ def is_pesummary_json_file_deprecated(path):
 
     Parameters
     ----------
-    path: str
-        path to results file
+    path: str, dict
+        path to results file or the already loaded contents of the file
     """
     return _is_pesummary_json_file(path, _check_pesummary_file_deprecated)
 
@@ -148,8 +180,6 @@ def _check_pesummary_file_deprecated(f):
     """
     if "posterior_samples" in f.keys():
         try:
-            import collections
-
             labels = f["posterior_samples"].keys()
             if isinstance(labels, collections.abc.KeysView):
                 _label = list(labels)[0]
@@ -214,7 +244,9 @@ CORE_DEFAULT_LOAD = {
 DEFAULT_FORMATS = ["default", "dat", "json", "hdf5", "h5", "txt"]
 
 
-def _read(path, load_options, default=CORE_DEFAULT_LOAD, **load_kwargs):
+def _read(
+    path, load_options, default=CORE_DEFAULT_LOAD, opener=None, **load_kwargs
+):
     """Try and load a result file according to multiple options
 
     Parameters
@@ -223,25 +255,38 @@ def _read(path, load_options, default=CORE_DEFAULT_LOAD, **load_kwargs):
         path to results file
     load_options: dict
         dictionary of checks and loading functions
+    opener: func, optional
+        context manager used to open the file once. The opened object is
+        passed to each check rather than the path. Default None
     """
-    for check, load in load_options.items():
-        if check(path):
-            try:
-                return load(path, **load_kwargs)
-            except ImportError as e:
-                logger.warning(
-                    "Failed due to import error: {}. Using default load".format(
-                        e
-                    )
+    checks = iter(load_options.keys())
+    while True:
+        # stop at the first check that passes. The file is closed before it
+        # is loaded and only reopened if the load fails
+        if opener is not None and len(load_options):
+            with opener(path) as f:
+                check = next((check for check in checks if check(f)), None)
+        else:
+            check = next((check for check in checks if check(path)), None)
+        if check is None:
+            break
+        load = load_options[check]
+        try:
+            return load(path, **load_kwargs)
+        except ImportError as e:
+            logger.warning(
+                "Failed due to import error: {}. Using default load".format(
+                    e
                 )
-                return default["default"](path, **load_kwargs)
-            except Exception as e:
-                logger.info(
-                    "Failed to read in {} with the {} class because {}".format(
-                        path, load, e
-                    )
+            )
+            return default["default"](path, **load_kwargs)
+        except Exception as e:
+            logger.info(
+                "Failed to read in {} with the {} class because {}".format(
+                    path, load, e
                 )
-                continue
+            )
+            continue
     if len(load_options):
         logger.warning(
             "Using the default load because {} failed the following checks: {}".format(
@@ -307,9 +352,13 @@ def read(
         path = unzip(path)
     if extension in ["hdf5", "h5", "hdf"]:
         options = _file_format(file_format, HDF5_LOAD)
-        return _read(path, options, default=DEFAULT, **kwargs)
+        return _read(
+            path, options, default=DEFAULT, opener=_open_hdf5_file, **kwargs
+        )
     elif extension == "json":
         options = _file_format(file_format, JSON_LOAD)
-        return _read(path, options, default=DEFAULT, **kwargs)
+        return _read(
+            path, options, default=DEFAULT, opener=_open_json_file, **kwargs
+        )
     else:
         return DEFAULT["default"](path, file_format=file_format, **kwargs)
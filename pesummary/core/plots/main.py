@@ -266,7 +266,7 @@ class _PlotGeneration(object):
         """
         from pesummary.utils.utils import _add_existing_data
 
-        self = _add_existing_data(self)
+        _add_existing_data(self)
 
     def _generate_plots(self, label):
         """Generate all plots for a a given result file
@@ -1,7 +1,5 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
-import numpy as np
-
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
 
@@ -37,9 +35,10 @@ class Base(object):
             the indent of the line
         """
         if type(content) == list:
-            for i in np.arange(len(content)):
-                content[i] == self._check_content(content[i])
-                self.html_file.write(" " * indent + content)
+            self.html_file.writelines(
+                " " * indent + self._check_content(_content) for _content in
+                content
+            )
         else:
             content = self._check_content(content)
             self.html_file.write(" " * indent + content)
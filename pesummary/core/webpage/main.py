@@ -1,10 +1,13 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
+import hashlib
+import json
 import os
 import sys
 import uuid
 from glob import glob
 from pathlib import Path
+from multiprocessing import Pool
 import shutil
 
 import numpy as np
@@ -19,6 +22,68 @@ from pesummary.core.webpage import webpage
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
+_WORKER_WEBPAGE = None
+
+
+def _initialise_worker(webpage_object):
+    """Store the webpage generation object on each worker process. This means
+    that the object (and its samples) are only transferred to each worker
+    once, rather than once per task
+
+    Parameters
+    ----------
+    webpage_object: _WebpageGeneration
+        the webpage generation object shared by all tasks
+    """
+    global _WORKER_WEBPAGE
+    _WORKER_WEBPAGE = webpage_object
+
+
+def _hash_page_inputs(*inputs):
+    """Return a short hash of the inputs used to generate a webpage. This is
+    used to check whether a webpage was generated from the same inputs
+
+    Parameters
+    ----------
+    *inputs: tuple
+        the inputs to hash. Each input may be an array, a nested
+        dictionary/list or any other object with a deterministic repr
+    """
+    _hash = hashlib.blake2b(digest_size=8)
+
+    def _update(value):
+        if isinstance(value, np.ndarray):
+            _hash.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, dict):
+            _hash.update(b"{")
+            for key, item in value.items():
+                _hash.update(str(key).encode() + b"\0")
+                _update(item)
+            _hash.update(b"}")
+        elif isinstance(value, (list, tuple)):
+            _hash.update(b"[")
+            for item in value:
+                _update(item)
+            _hash.update(b"]")
+        else:
+            _hash.update(repr(value).encode() + b"\0")
+
+    for value in inputs:
+        _update(value)
+    return _hash.hexdigest()
+
+
+def _make_1d_histogram_pages_for_label(label):
+    """Make the 1d histogram pages for a single result file with the webpage
+    generation object stored on the worker process
+
+    Parameters
+    ----------
+    label: str
+        the label of the result file that you wish to make pages for
+    """
+    return _WORKER_WEBPAGE._make_1d_histogram_pages_for_label(label)
+
 
 class PlotCaption(object):
     """Class to handle the generation of a plot caption
@@ -98,6 +163,13 @@ class _WebpageGeneration(object):
         dictionary of package information
     mcmc_samples: Bool
         Whether or not mcmc samples have been passed
+    multi_process: int, optional
+        number of cores to use when generating the webpages for each result
+        file. Default 1
+    checkpoint: Bool, optional
+        if True, do not regenerate the webpages for each parameter which were
+        completed by a previous run with the same inputs. Completed pages
+        are recorded in webdir/html/.done. Default False
     """
     def __init__(
         self, webdir=None, samples=None, labels=None, publication=None,
@@ -111,6 +183,7 @@ class _WebpageGeneration(object):
         package_information={"packages": [], "manager": "pypi"},
         mcmc_samples=False, external_hdf5_links=False, key_data=None,
         existing_plot=None, disable_expert=False, analytic_priors=None,
+        multi_process=1, checkpoint=False
     ):
         self.webdir = webdir
         make_dir(self.webdir)
@@ -169,6 +242,10 @@ class _WebpageGeneration(object):
         self.external_hdf5_links = external_hdf5_links
         self.existing_plot = existing_plot
         self.expert_plots = not disable_expert
+        self.multi_process = multi_process
+        self.checkpoint = checkpoint
+        self._checkpointed_pages = []
+        self._page_hash = {}
         self.make_comparison = (
             not disable_comparison and self._total_number_of_labels > 1
         )
@@ -716,6 +793,27 @@ class _WebpageGeneration(object):
             "{}_{}_{}".format(i, i, j) for i in self.labels for j in
             self.samples[i].keys()
         ]
+        # each page depends on the samples and summary statistics for its
+        # label as well as the navbar and colour, which change if a label is
+        # added, removed or renamed
+        self._page_hash = {
+            i: _hash_page_inputs(
+                sorted(self.labels), self.samples[i], self.key_data[i],
+                self.navbar["result_page"][i], self.colors[num]
+            ) for num, i in enumerate(self.labels)
+        }
+        if self.checkpoint:
+            completed = self._read_checkpoint_file()
+            self._checkpointed_pages = [
+                "{}_{}_{}".format(i, i, j) for i in self.labels for j in
+                self.samples[i].keys() if
+                completed.get((i, j)) == self._page_hash[i]
+            ]
+            pages = [
+                page for page in pages if page not in self._checkpointed_pages
+            ]
+        elif os.path.isfile(self._checkpoint_file):
+            os.remove(self._checkpoint_file)
         pages += ["{}_{}_Custom".format(i, i) for i in self.labels]
         pages += ["{}_{}_All".format(i, i) for i in self.labels]
         for i in self.labels:
@@ -731,6 +829,48 @@ class _WebpageGeneration(object):
         self.create_blank_html_pages(pages)
         self._make_1d_histogram_pages(pages)
 
+    @property
+    def _checkpoint_file(self):
+        return os.path.join(self.webdir, "html", ".done")
+
+    def _read_checkpoint_file(self):
+        """Return a dictionary mapping (label, parameter) to the hash of the
+        inputs used to generate each completed parameter webpage
+        """
+        completed = {}
+        if not os.path.isfile(self._checkpoint_file):
+            return completed
+        with open(self._checkpoint_file, "r") as f:
+            for line in f:
+                try:
+                    label, param, _hash = json.loads(line)
+                except ValueError:
+                    # the final entry may be incomplete if the run was
+                    # interrupted while writing it
+                    continue
+                completed[(label, param)] = _hash
+        return completed
+
+    def _record_checkpoint(self, label, param):
+        """Record that the webpage for a given parameter has been completed.
+        Each entry is appended as a separate line so that pages generated
+        by different processes can be recorded in the same file
+
+        Parameters
+        ----------
+        label: str
+            the label of the result file
+        param: str
+            the name of the parameter
+        """
+        if label not in self._page_hash:
+            return
+        with open(self._checkpoint_file, "a") as f:
+            f.write(
+                json.dumps([label, str(param), self._page_hash[label]])
+                + "\n"
+            )
+
     def _make_1d_histogram_pages(self, pages):
         """Make the 1d histogram pages
 
@@ -739,237 +879,259 @@ class _WebpageGeneration(object):
         pages: list
             list of pages that you wish to create
         """
-        for num, i in enumerate(self.labels):
-            if len(self._additional_1d_pages[i]):
-                for j in self._additional_1d_pages[i]:
-                    _parameters = self.additional_1d_pages[j]
-                    html_file = self.setup_page(
-                        "{}_{}".format(i, j), self.navbar["result_page"][i],
-                        i, title="{} Posterior PDFs describing {}".format(i, j),
-                        approximant=i, background_colour=self.colors[num],
-                        histogram_download=False, toggle=self.expert_plots
-                    )
-                    html_file.make_banner(approximant=i, key=i)
-                    path = self.image_path["other"]
-                    _plots = [
-                        path + "{}_1d_posterior_{}.png".format(i, param) for
-                        param in _parameters
-                    ]
-                    contents = [
-                        _plots[i:2 + i] for i in range(0, len(_plots), 2)
-                    ]
-                    html_file.make_table_of_images(
-                        contents=contents, code="changeimage",
-                        mcmc_samples=self.mcmc_samples, autoscale=True
-                    )
-                    key_data = self.key_data
-                    contents = []
-                    headings = [" "] + self.key_data_headings.copy()
-                    _injection = False
-                    rows = []
-                    for param in _parameters:
-                        _row = [param]
-                        _row += self.key_data_table[i][param]
-                        rows.append(_row)
-                    _style = "margin-top:3em; margin-bottom:5em; max-width:1400px"
-                    _class = "row justify-content-center"
-                    html_file.make_container(style=_style)
-                    html_file.make_div(4, _class=_class, _style=None)
-                    html_file.make_table(
-                        headings=headings, contents=rows, heading_span=1,
-                        accordian=False, format="table-hover"
-                    )
-                    html_file.end_div(4)
-                    html_file.end_container()
-                    html_file.export("summary_information_{}.csv".format(i))
-                    html_file.make_footer(user=self.user, rundir=self.webdir)
-                    html_file.close()
-            for j in self.samples[i].keys():
+        if self.multi_process is not None and int(self.multi_process) > 1:
+            processes = min(int(self.multi_process), len(self.labels))
+            with Pool(
+                processes=processes, initializer=_initialise_worker,
+                initargs=(self,)
+            ) as pool:
+                pool.map(_make_1d_histogram_pages_for_label, self.labels)
+        else:
+            for i in self.labels:
+                self._make_1d_histogram_pages_for_label(i)
+
+    def _make_1d_histogram_pages_for_label(self, i):
+        """Make the 1d histogram pages for a single result file
+
+        Parameters
+        ----------
+        i: str
+            the label of the result file that you wish to make pages for
+        """
+        num = self.labels.index(i)
+        if len(self._additional_1d_pages[i]):
+            for j in self._additional_1d_pages[i]:
+                _parameters = self.additional_1d_pages[j]
                 html_file = self.setup_page(
                     "{}_{}".format(i, j), self.navbar["result_page"][i],
-                    i, title="{} Posterior PDF for {}".format(i, j),
+                    i, title="{} Posterior PDFs describing {}".format(i, j),
                     approximant=i, background_colour=self.colors[num],
                     histogram_download=False, toggle=self.expert_plots
                 )
-                if j.description != "Unknown parameter description":
-                    _custom = (
-                        "The figures below show the plots for {}: {}"
-                    )
-                    html_file.make_banner(
-                        approximant=i, key="custom",
-                        custom=_custom.format(j, j.description)
-                    )
-                else:
-                    html_file.make_banner(approximant=i, key=i)
+                html_file.make_banner(approximant=i, key=i)
                 path = self.image_path["other"]
-                contents = [
-                    [path + "{}_1d_posterior_{}.png".format(i, j)],
-                    [
-                        path + "{}_sample_evolution_{}.png".format(i, j),
-                        path + "{}_autocorrelation_{}.png".format(i, j)
-                    ]
+                _plots = [
+                    path + "{}_1d_posterior_{}.png".format(i, param) for
+                    param in _parameters
                 ]
-                captions = [
-                    [PlotCaption("1d_histogram").format(j)],
-                    [
-                        PlotCaption("sample_evolution").format(j),
-                        PlotCaption("autocorrelation").format(j)
-                    ]
-                ]
-                html_file.make_table_of_images(
-                    contents=contents, rows=1, columns=2, code="changeimage",
-                    captions=captions, mcmc_samples=self.mcmc_samples
-                )
                 contents = [
-                    [path + "{}_2d_contour_{}_log_likelihood.png".format(i, j)],
-                    [
-                        path + "{}_sample_evolution_{}_{}_colored.png".format(
-                            i, j, "log_likelihood"
-                        ), path + "{}_1d_posterior_{}_bootstrap.png".format(i, j)
-                    ]
+                    _plots[i:2 + i] for i in range(0, len(_plots), 2)
                 ]
-                captions = [
-                    [PlotCaption("2d_contour").format(j, "log_likelihood")],
-                    [
-                        PlotCaption("sample_evolution_colored").format(
-                            j, "log_likelihood"
-                        ),
-                        PlotCaption("1d_histogram_bootstrap").format(100, j, 1000)
-                    ],
-                ]
-                if self.expert_plots:
-                    html_file.make_table_of_images(
-                        contents=contents, rows=1, columns=2, code="changeimage",
-                        captions=captions, mcmc_samples=self.mcmc_samples,
-                        display='none', container_id='expert_div',
-                        close_container=False
-                    )
-                    _additional = self.add_to_expert_pages(path, i)
-                    if _additional is not None and j in _additional.keys():
-                        html_file.make_table_of_images(
-                            contents=_additional[j], code="changeimage",
-                            mcmc_samples=self.mcmc_samples,
-                            autoscale=True, display='none',
-                            add_to_open_container=True,
-                        )
-                    html_file.end_div()
-                html_file.export(
-                    "", csv=False, json=False, shell=False, margin_bottom="1em",
-                    histogram_dat=os.path.join(
-                        self.results_path["other"], i, "{}_{}.dat".format(i, j)
-                    )
+                html_file.make_table_of_images(
+                    contents=contents, code="changeimage",
+                    mcmc_samples=self.mcmc_samples, autoscale=True
                 )
                 key_data = self.key_data
                 contents = []
-                headings = self.key_data_headings.copy()
+                headings = [" "] + self.key_data_headings.copy()
                 _injection = False
-                if "injected" in headings:
-                    _injection = not math.isnan(self.key_data[i][j]["injected"])
-                row = self.key_data_table[i][j]
-                if _injection:
-                    headings.append("injected")
-                    row.append(safe_round(self.key_data[i][j]["injected"], 3))
+                rows = []
+                for param in _parameters:
+                    _row = [param]
+                    _row += self.key_data_table[i][param]
+                    rows.append(_row)
                 _style = "margin-top:3em; margin-bottom:5em; max-width:1400px"
                 _class = "row justify-content-center"
                 html_file.make_container(style=_style)
                 html_file.make_div(4, _class=_class, _style=None)
                 html_file.make_table(
-                    headings=headings, contents=[row], heading_span=1,
+                    headings=headings, contents=rows, heading_span=1,
                     accordian=False, format="table-hover"
                 )
                 html_file.end_div(4)
                 html_file.end_container()
-                html_file.export(
-                    "summary_information_{}.csv".format(i)
-                )
+                html_file.export("summary_information_{}.csv".format(i))
                 html_file.make_footer(user=self.user, rundir=self.webdir)
                 html_file.close()
+        path = self.image_path["other"]
+        for j in self.samples[i].keys():
+            if "{}_{}_{}".format(i, i, j) in self._checkpointed_pages:
+                continue
             html_file = self.setup_page(
-                "{}_Custom".format(i), self.navbar["result_page"][i],
-                i, title="{} Posteriors for multiple".format(i),
-                approximant=i, background_colour=self.colors[num]
+                "{}_{}".format(i, j), self.navbar["result_page"][i],
+                i, title="{} Posterior PDF for {}".format(i, j),
+                approximant=i, background_colour=self.colors[num],
+                histogram_download=False, toggle=self.expert_plots
             )
-            html_file.make_banner(approximant=i, key=i)
-            ordered_parameters = self.categorize_parameters(
-                self.samples[i].keys()
+            if j.description != "Unknown parameter description":
+                _custom = (
+                    "The figures below show the plots for {}: {}"
+                )
+                html_file.make_banner(
+                    approximant=i, key="custom",
+                    custom=_custom.format(j, j.description)
+                )
+            else:
+                html_file.make_banner(approximant=i, key=i)
+            contents = [
+                [path + "{}_1d_posterior_{}.png".format(i, j)],
+                [
+                    path + "{}_sample_evolution_{}.png".format(i, j),
+                    path + "{}_autocorrelation_{}.png".format(i, j)
+                ]
+            ]
+            captions = [
+                [PlotCaption("1d_histogram").format(j)],
+                [
+                    PlotCaption("sample_evolution").format(j),
+                    PlotCaption("autocorrelation").format(j)
+                ]
+            ]
+            html_file.make_table_of_images(
+                contents=contents, rows=1, columns=2, code="changeimage",
+                captions=captions, mcmc_samples=self.mcmc_samples
             )
-            ordered_parameters = [i for j in ordered_parameters for i in j[1]]
-            popular_options = self.popular_options
-            html_file.make_search_bar(
-                sidebar=[i for i in self.samples[i].keys()],
-                popular_options=popular_options + [{
-                    "all": ", ".join(ordered_parameters)
-                }],
-                label=self.labels[num], code="combines"
+            contents = [
+                [path + "{}_2d_contour_{}_log_likelihood.png".format(i, j)],
+                [
+                    path + "{}_sample_evolution_{}_{}_colored.png".format(
+                        i, j, "log_likelihood"
+                    ), path + "{}_1d_posterior_{}_bootstrap.png".format(i, j)
+                ]
+            ]
+            captions = [
+                [PlotCaption("2d_contour").format(j, "log_likelihood")],
+                [
+                    PlotCaption("sample_evolution_colored").format(
+                        j, "log_likelihood"
+                    ),
+                    PlotCaption("1d_histogram_bootstrap").format(100, j, 1000)
+                ],
+            ]
+            if self.expert_plots:
+                html_file.make_table_of_images(
+                    contents=contents, rows=1, columns=2, code="changeimage",
+                    captions=captions, mcmc_samples=self.mcmc_samples,
+                    display='none', container_id='expert_div',
+                    close_container=False
+                )
+                _additional = self.add_to_expert_pages(path, i)
+                if _additional is not None and j in _additional.keys():
+                    html_file.make_table_of_images(
+                        contents=_additional[j], code="changeimage",
+                        mcmc_samples=self.mcmc_samples,
+                        autoscale=True, display='none',
+                        add_to_open_container=True,
+                    )
+                html_file.end_div()
+            html_file.export(
+                "", csv=False, json=False, shell=False, margin_bottom="1em",
+                histogram_dat=os.path.join(
+                    self.results_path["other"], i, "{}_{}.dat".format(i, j)
+                )
+            )
+            key_data = self.key_data
+            contents = []
+            headings = self.key_data_headings.copy()
+            _injection = False
+            if "injected" in headings:
+                _injection = not math.isnan(self.key_data[i][j]["injected"])
+            row = self.key_data_table[i][j].copy()
+            if _injection:
+                headings.append("injected")
+                row.append(safe_round(self.key_data[i][j]["injected"], 3))
+            _style = "margin-top:3em; margin-bottom:5em; max-width:1400px"
+            _class = "row justify-content-center"
+            html_file.make_container(style=_style)
+            html_file.make_div(4, _class=_class, _style=None)
+            html_file.make_table(
+                headings=headings, contents=[row], heading_span=1,
+                accordian=False, format="table-hover"
+            )
+            html_file.end_div(4)
+            html_file.end_container()
+            html_file.export(
+                "summary_information_{}.csv".format(i)
             )
             html_file.make_footer(user=self.user, rundir=self.webdir)
             html_file.close()
+            self._record_checkpoint(i, j)
+        html_file = self.setup_page(
+            "{}_Custom".format(i), self.navbar["result_page"][i],
+            i, title="{} Posteriors for multiple".format(i),
+            approximant=i, background_colour=self.colors[num]
+        )
+        html_file.make_banner(approximant=i, key=i)
+        ordered_parameters = self.categorize_parameters(
+            self.samples[i].keys()
+        )
+        ordered_parameters = [i for j in ordered_parameters for i in j[1]]
+        popular_options = self.popular_options
+        html_file.make_search_bar(
+            sidebar=[i for i in self.samples[i].keys()],
+            popular_options=popular_options + [{
+                "all": ", ".join(ordered_parameters)
+            }],
+            label=self.labels[num], code="combines"
+        )
+        html_file.make_footer(user=self.user, rundir=self.webdir)
+        html_file.close()
+        html_file = self.setup_page(
+            "{}_All".format(i), self.navbar["result_page"][i],
+            i, title="All posteriors for {}".format(i),
+            approximant=i, background_colour=self.colors[num]
+        )
+        html_file.make_banner(approximant=i, key=i)
+        for j in self.samples[i].keys():
+            html_file.make_banner(
+                approximant=j, _style="font-size: 26px;"
+            )
+            contents = [
+                [path + "{}_1d_posterior_{}.png".format(i, j)],
+                [
+                    path + "{}_sample_evolution_{}.png".format(i, j),
+                    path + "{}_autocorrelation_{}.png".format(i, j)
+                ]
+            ]
+            html_file.make_table_of_images(
+                contents=contents, rows=1, columns=2, code="changeimage")
+        html_file.close()
+        for j in self.categorize_parameters(self.samples[i].keys()):
+            if not len(j[1]):
+                continue
             html_file = self.setup_page(
-                "{}_All".format(i), self.navbar["result_page"][i],
-                i, title="All posteriors for {}".format(i),
+                "{}_{}_all".format(i, j[0]), self.navbar["result_page"][i],
+                i, title="All posteriors for describing {}".format(j[0]),
                 approximant=i, background_colour=self.colors[num]
             )
-            html_file.make_banner(approximant=i, key=i)
-            for j in self.samples[i].keys():
+            for k in j[1][1:]:
                 html_file.make_banner(
-                    approximant=j, _style="font-size: 26px;"
+                    approximant=k, _style="font-size: 26px;"
                 )
                 contents = [
-                    [path + "{}_1d_posterior_{}.png".format(i, j)],
+                    [path + "{}_1d_posterior_{}.png".format(i, k)],
                     [
-                        path + "{}_sample_evolution_{}.png".format(i, j),
-                        path + "{}_autocorrelation_{}.png".format(i, j)
+                        path + "{}_sample_evolution_{}.png".format(i, k),
+                        path + "{}_autocorrelation_{}.png".format(i, k)
                     ]
                 ]
                 html_file.make_table_of_images(
-                    contents=contents, rows=1, columns=2, code="changeimage")
-            html_file.close()
-            for j in self.categorize_parameters(self.samples[i].keys()):
-                if not len(j[1]):
-                    continue
-                html_file = self.setup_page(
-                    "{}_{}_all".format(i, j[0]), self.navbar["result_page"][i],
-                    i, title="All posteriors for describing {}".format(j[0]),
-                    approximant=i, background_colour=self.colors[num]
-                )
-                for k in j[1][1:]:
-                    html_file.make_banner(
-                        approximant=k, _style="font-size: 26px;"
-                    )
-                    contents = [
-                        [path + "{}_1d_posterior_{}.png".format(i, k)],
-                        [
-                            path + "{}_sample_evolution_{}.png".format(i, k),
-                            path + "{}_autocorrelation_{}.png".format(i, k)
-                        ]
-                    ]
-                    html_file.make_table_of_images(
-                        contents=contents, rows=1, columns=2, code="changeimage"
-                    )
-                html_file.make_banner(
-                    approximant="Summary Table", key="summary_table",
-                    _style="font-size: 26px;"
-                )
-                _style = "margin-top:3em; margin-bottom:5em; max-width:1400px"
-                _class = "row justify-content-center"
-                html_file.make_container(style=_style)
-                html_file.make_div(4, _class=_class, _style=None)
-                headings = [" "] + self.key_data_headings.copy()
-                contents = []
-                for k in j[1][1:]:
-                    row = [k]
-                    row += self.key_data_table[i][k]
-                    contents.append(row)
-                html_file.make_table(
-                    headings=headings, contents=contents, heading_span=1,
-                    accordian=False, format="table-hover",
-                    sticky_header=True
+                    contents=contents, rows=1, columns=2, code="changeimage"
                 )
-                html_file.end_div(4)
-                html_file.end_container()
-                html_file.export("{}_summary_{}.csv".format(j[0], i))
-                html_file.make_footer(user=self.user, rundir=self.webdir)
-                html_file.close()
+            html_file.make_banner(
+                approximant="Summary Table", key="summary_table",
+                _style="font-size: 26px;"
+            )
+            _style = "margin-top:3em; margin-bottom:5em; max-width:1400px"
+            _class = "row justify-content-center"
+            html_file.make_container(style=_style)
+            html_file.make_div(4, _class=_class, _style=None)
+            headings = [" "] + self.key_data_headings.copy()
+            contents = []
+            for k in j[1][1:]:
+                row = [k]
+                row += self.key_data_table[i][k]
+                contents.append(row)
+            html_file.make_table(
+                headings=headings, contents=contents, heading_span=1,
+                accordian=False, format="table-hover",
+                sticky_header=True
+            )
+            html_file.end_div(4)
+            html_file.end_container()
+            html_file.export("{}_summary_{}.csv".format(j[0], i))
+            html_file.make_footer(user=self.user, rundir=self.webdir)
+            html_file.close()
 
     def make_additional_plots_pages(self):
         """Wrapper function for _make_additional_plots_pages
@@ -1857,7 +2019,7 @@ class _WebpageGeneration(object):
         """
         from pesummary.utils.utils import _add_existing_data
 
-        self = _add_existing_data(self)
+        _add_existing_data(self)
 
     def add_to_expert_pages(self, path, label):
         """Additional expert plots to add beyond the default. This returns a
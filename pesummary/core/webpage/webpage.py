@@ -108,25 +108,30 @@ def make_html(web_dir, title="Summary Pages", pages=None, stylesheets=[],
         This should be provided as basenames without extension that is assumed
         to be `.css`.
     """
+    stylesheet_elements = ''.join([
+        "  <link rel='stylesheet' href='../css/{0:s}.css'>\n".format(s)
+        for s in stylesheets])
+    bootstrap = BOOTSTRAP.split("\n")
+    bootstrap[1] = "  <title>{}</title>".format(title)
+    bootstrap[-4] = stylesheet_elements
+    bootstrap = "".join([j + "\n" for j in bootstrap])
+    # the skeleton is identical for every page (other than home) so only
+    # render it once
+    skeleton = {
+        key: bootstrap + "".join([j + "\n" for j in scripts.split("\n")])
+        for key, scripts in {
+            "home": HOME_SCRIPTS, "other": OTHER_SCRIPTS
+        }.items()
+    }
     for i in pages:
         if i != "home":
-            f = open("{}/html/{}.html".format(web_dir, i), "w")
+            filename = "{}/html/{}.html".format(web_dir, i)
+            contents = skeleton["other"]
         else:
-            f = open("{}/{}.html".format(web_dir, i), "w")
-        stylesheet_elements = ''.join([
-            "  <link rel='stylesheet' href='../css/{0:s}.css'>\n".format(s)
-            for s in stylesheets])
-        bootstrap = BOOTSTRAP.split("\n")
-        bootstrap[1] = "  <title>{}</title>".format(title)
-        bootstrap[-4] = stylesheet_elements
-        bootstrap = [j + "\n" for j in bootstrap]
-        f.writelines(bootstrap)
-        if i != "home":
-            scripts = OTHER_SCRIPTS.split("\n")
-        else:
-            scripts = HOME_SCRIPTS.split("\n")
-        scripts = [j + "\n" for j in scripts]
-        f.writelines(scripts)
+            filename = "{}/{}.html".format(web_dir, i)
+            contents = skeleton["home"]
+        with open(filename, "w") as f:
+            f.write(contents)
 
 
 def open_html(web_dir, base_url, html_page, label=None):
@@ -44,7 +44,10 @@ class _GWInput(pesummary.core.cli.inputs._Input):
             nsamples=nsamples, _replace_with_pesummary_kwargs=_replace_kwargs,
             **kwargs
         )
-        f = GWRead(existing_file)
+        if compare:
+            f = GWRead(existing_file, labels=compare)
+        else:
+            f = GWRead(existing_file)
 
         labels = data["labels"]
 
@@ -950,7 +953,7 @@ class SamplesInput(_GWInput, pesummary.core.cli.inputs.SamplesInput):
 
     @maxL_samples.setter
     def maxL_samples(self, maxL_samples):
-        key_data = self.grab_key_data_from_result_files()
+        key_data = self.key_data
         maxL_samples = {
             i: {
                 j: key_data[i][j]["maxL"] for j in key_data[i].keys()
@@ -2,7 +2,8 @@
 
 from pesummary.gw.file.formats.base_read import GWMultiAnalysisRead
 from pesummary.core.file.formats.pesummary import (
-    PESummary as CorePESummary, PESummaryDeprecated as CorePESummaryDeprecated
+    PESummary as CorePESummary, PESummaryDeprecated as CorePESummaryDeprecated,
+    _structured_to_2d_array
 )
 from pesummary.utils.dict import load_recursively
 from pesummary.utils.decorators import deprecation
@@ -53,6 +54,9 @@ class PESummary(GWMultiAnalysisRead, CorePESummary):
         path to the results file you wish to load
     remove_nan_likelihood_samples: Bool, optional
         if True, remove samples which have log_likelihood='nan'. Default True
+    labels: list, optional
+        list of analyses that you wish to load from the result file. Default
+        load all analyses
 
     Attributes
     ----------
@@ -119,7 +123,8 @@ class PESummary(GWMultiAnalysisRead, CorePESummary):
     """
     def __init__(self, path_to_results_file, **kwargs):
         super(PESummary, self).__init__(
-            path_to_results_file=path_to_results_file
+            path_to_results_file=path_to_results_file,
+            labels=kwargs.get("labels", None)
         )
 
     @property
@@ -360,9 +365,9 @@ class TGRPESummary(PESummary):
                     parameters = [
                         j for j in posterior_samples[analysis].dtype.names
                     ]
-                    samples = [
-                        np.array(j.tolist()) for j in posterior_samples[analysis]
-                    ]
+                    samples = _structured_to_2d_array(
+                        posterior_samples[analysis]
+                    )
                     if isinstance(parameters[0], bytes):
                         parameters = [
                             parameter.decode("utf-8") for parameter in parameters
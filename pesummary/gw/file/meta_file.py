@@ -215,7 +215,7 @@ class _TGRMetaFile(_GWMetaFile):
                     samples = np.array([_samples[i] for i in parameters]).T
                     dictionary[label]["posterior_samples"][analysis] = {
                         "parameter_names": list(parameters),
-                        "samples": samples.tolist()
+                        "samples": samples
                     }
                 deviations = "final_mass_final_spin_deviations"
                 _imrct_data = self.tgr_data["imrct"][label][deviations]
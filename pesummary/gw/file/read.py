@@ -11,7 +11,7 @@ from pesummary.core.file.read import (
     is_bilby_hdf5_file, is_bilby_json_file, is_pesummary_hdf5_file,
     is_pesummary_json_file, is_pesummary_hdf5_file_deprecated,
     is_pesummary_json_file_deprecated, _is_pesummary_hdf5_file,
-    _is_pesummary_json_file
+    _is_pesummary_json_file, _open_hdf5_file
 )
 from pesummary.core.file.read import read as CoreRead
 
@@ -24,14 +24,11 @@ def is_GWTC1_file(path):
 
     Parameters
     ----------
-    path: str
-        path to the results file
+    path: str, h5py.File
+        path to the results file or an open h5py.File object
     """
-    import h5py
-
-    f = h5py.File(path, 'r')
-    keys = list(f.keys())
-    f.close()
+    with _open_hdf5_file(path) as f:
+        keys = list(f.keys())
     if "Overall_posterior" in keys or "overall_posterior" in keys:
         return True
     return False
@@ -42,13 +39,11 @@ def is_lalinference_file(path):
 
     Parameters
     ----------
-    path: str
-        path to the results file
+    path: str, h5py.File
+        path to the results file or an open h5py.File object
     """
-    import h5py
-    f = h5py.File(path, 'r')
-    keys = list(f.keys())
-    f.close()
+    with _open_hdf5_file(path) as f:
+        keys = list(f.keys())
     if "lalinference" in keys:
         return True
     return False
@@ -59,8 +54,8 @@ def is_tgr_pesummary_hdf5_file(path):
 
     Parameters
     ----------
-    path: str
-        path to results file
+    path: str, h5py.File
+        path to results file or an open h5py.File object
     """
     return _is_pesummary_hdf5_file(path, _check_tgr_pesummary_file)
 
@@ -70,8 +65,8 @@ def is_tgr_pesummary_json_file(path):
 
     Parameters
     ----------
-    path: str
-        path to results file
+    path: str, dict
+        path to results file or the already loaded contents of the file
     """
     return _is_pesummary_json_file(path, _check_tgr_pesummary_file)
 
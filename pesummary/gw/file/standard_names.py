@@ -1,5 +1,8 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
+import sys
+import types
+
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 _IFOS = ["H1", "L1", "V1", "K1", "E1"]
 tidal_params = ["lambda_1", "lambda_2", "delta_lambda", "lambda_tilde"]
@@ -330,11 +333,15 @@ for detector in _IFOS:
     )
 
 
-standard_names = {}
-standard_names.update(lalinference_map)
-standard_names.update(bilby_map)
-standard_names.update(pycbc_map)
-standard_names.update(other_map)
+_standard_names = {}
+_standard_names.update(lalinference_map)
+_standard_names.update(bilby_map)
+_standard_names.update(pycbc_map)
+_standard_names.update(other_map)
+standard_names = types.MappingProxyType({
+    sys.intern(key): sys.intern(value) for key, value in
+    _standard_names.items()
+})
 
 descriptive_names = {
     "log_likelihood": (
@@ -119,6 +119,10 @@ class _PlotGeneration(_BasePlotGeneration):
     def generate_plots(self):
         """Generate all plots for all result files
         """
+        # the ligo.skymap plots are generated in a subprocess. Launch them
+        # first so that they run alongside the remaining plots and webpages
+        for i in self.labels:
+            self.try_to_make_a_plot("skymap", label=i)
         if self.calibration or "calibration" in list(self.priors.keys()):
             self.try_to_make_a_plot("calibration")
         if self.psd:
@@ -129,7 +133,6 @@ class _PlotGeneration(_BasePlotGeneration):
         """Generate all plots for a given result file
         """
         super(_PlotGeneration, self)._generate_plots(label)
-        self.try_to_make_a_plot("skymap", label=label)
         self.try_to_make_a_plot("waveform_td", label=label)
         self.try_to_make_a_plot("waveform_fd", label=label)
         if self.pepredicates_probs[label] is not None:
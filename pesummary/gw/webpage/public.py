@@ -24,7 +24,7 @@ class _PublicWebpageGeneration(_GWWebpageGeneration):
         psd=None, priors=None, package_information={"packages": []},
         mcmc_samples=False, external_hdf5_links=False,
         preliminary_pages=False, existing_plot=None, disable_expert=False,
-        analytic_priors=None
+        analytic_priors=None, multi_process=1, checkpoint=False
     ):
         super(_PublicWebpageGeneration, self).__init__(
             webdir=webdir, samples=samples, labels=labels,
@@ -50,7 +50,8 @@ class _PublicWebpageGeneration(_GWWebpageGeneration):
             package_information=package_information,
             mcmc_samples=mcmc_samples, external_hdf5_links=external_hdf5_links,
             preliminary_pages=preliminary_pages, existing_plot=existing_plot,
-            disable_expert=disable_expert, analytic_priors=analytic_priors
+            disable_expert=disable_expert, analytic_priors=analytic_priors,
+            multi_process=multi_process, checkpoint=checkpoint
         )
 
     def setup_page(
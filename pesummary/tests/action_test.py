@@ -1,4 +1,7 @@
-from pesummary.core.cli.actions import ConfigAction
+from pesummary.core.cli.actions import (
+    ConfigAction, CheckFilesExistAction, DictionaryAction
+)
+import pytest
 
 def test_dict_from_str():
     f = ConfigAction.dict_from_str("{'H1':10, 'L1':20}")
@@ -42,7 +45,81 @@ def test_list_from_str():
     assert f == [1,2,3]
     f = ConfigAction.list_from_str('1,    2,  3', dtype=int)
     assert f == [1,2,3]
+    f = ConfigAction.list_from_str('[1, 2,3]', dtype=int)
+    assert f == [1,2,3]
+    f = ConfigAction.list_from_str('[1]', dtype=int)
+    assert f == [1]
+    f = ConfigAction.list_from_str('[]')
+    assert f == []
     f = ConfigAction.list_from_str("[/home/IFO0.dat, /home/IFO1.dat]")
     assert f == ["/home/IFO0.dat", "/home/IFO1.dat"]
     f = ConfigAction.list_from_str("['/home/IFO0.dat', '/home/IFO1.dat']")
     assert f == ["/home/IFO0.dat", "/home/IFO1.dat"]
+
+def test_check_files_exist(tmp_path):
+    files = [str(tmp_path / "file_{}.dat".format(num)) for num in range(5)]
+    for ff in files:
+        open(ff, "w").close()
+    action = CheckFilesExistAction(option_strings=["--samples"], dest="samples")
+    action.check_input(files)
+    action.check_input({"one": files[0], "two": files[1:]})
+    action.check_input(files + ["none", "username@server:/home/file.dat"])
+    with pytest.raises(FileNotFoundError, match="file_missing.dat"):
+        action.check_input(files + [str(tmp_path / "file_missing.dat")])
+    with pytest.raises(FileNotFoundError):
+        action.check_input(str(tmp_path / "file_missing.dat"))
+
+
+def test_dictionary_action():
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--gwdata", action=DictionaryAction, nargs="+")
+    opts = parser.parse_args(
+        ["--gwdata", "H1:GDS-CALIB_STRAIN:/home/H1.lcf", "L1:/home/L1.lcf",
+         "L1:/home/L1_2.lcf"]
+    )
+    assert opts.gwdata["H1:GDS-CALIB_STRAIN"] == "/home/H1.lcf"
+    assert opts.gwdata["L1"] == ["/home/L1.lcf", "/home/L1_2.lcf"]
+    opts = parser.parse_args(["--gwdata", "/home/H1.pickle"])
+    assert opts.gwdata == ["/home/H1.pickle"]
+    with pytest.raises(ValueError):
+        parser.parse_args(["--gwdata", "H1:/home/H1.lcf", "/home/L1.pickle"])
+
+
+def test_config_action(tmp_path):
+    import argparse
+    import os
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", action=ConfigAction)
+    parser.add_argument("--nsamples", type=int)
+    parser.add_argument("--labels", nargs="+")
+    config = tmp_path / "config.ini"
+    config.write_text("[core]\nnsamples = 10\nlabels = [one, two]\n")
+    opts = parser.parse_args(["--config", str(config)])
+    assert opts.nsamples == 10
+    assert opts.labels == ["one", "two"]
+    config.write_text("[core]\nnsamples = 200\n")
+    # make sure the modification time changes
+    os.utime(config, ns=(0, 0))
+    opts = parser.parse_args(["--config", str(config)])
+    assert opts.nsamples == 200
+    assert opts.labels is None
+    opts = parser.parse_args(["--config", str(tmp_path / "missing.ini")])
+    assert opts.nsamples is None
+
+
+def test_config_action_errors(tmp_path, capsys):
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", action=ConfigAction)
+    parser.add_argument("--nsamples", type=int)
+    config = tmp_path / "config.ini"
+    config.write_text("[core]\nnsamples = abc\n")
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--config", str(config)])
+    assert "Failed to parse 'nsamples'" in capsys.readouterr().err
+    malformed = tmp_path / "malformed.ini"
+    malformed.write_text("nsamples = 10\n")
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--config", str(malformed)])
+    assert str(malformed) in capsys.readouterr().err
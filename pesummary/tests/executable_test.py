@@ -1327,12 +1327,25 @@ class TestSummaryCombine(Base):
         self.launch(command_line)
         compressed_size = os.stat("{}/samples/posterior_samples2.h5".format(tmpdir)).st_size
         assert compressed_size < original_size
+        command_line = (
+            "summarycombine --webdir {0} --samples "
+            "{0}/example.json --label gw0 --no_conversion --gw "
+            "--psd H1:{0}/psd.dat --calibration L1:{0}/calibration.dat "
+            "--hdf5_compression lzf --posterior_samples_filename "
+            "posterior_samples3.h5".format(tmpdir)
+        )
+        self.launch(command_line)
+        lzf_size = os.stat("{}/samples/posterior_samples3.h5".format(tmpdir)).st_size
+        assert lzf_size < original_size
 
         f = read("{}/samples/posterior_samples.h5".format(tmpdir))
         g = read("{}/samples/posterior_samples2.h5".format(tmpdir))
+        h = read("{}/samples/posterior_samples3.h5".format(tmpdir))
         posterior_samples = f.samples[0]
         posterior_samples2 = g.samples[0]
+        posterior_samples3 = h.samples[0]
         np.testing.assert_almost_equal(posterior_samples, posterior_samples2)
+        np.testing.assert_almost_equal(posterior_samples, posterior_samples3)
 
     @pytest.mark.executabletest
     def test_seed(self):
@@ -654,6 +654,16 @@ class TestInput(object):
             assert self.inputs.maxL_samples["example"][param] == self.samples.T[ind][max_ind]
         assert self.inputs.maxL_samples["example"]["approximant"] == "IMRPhenomPv2"
 
+    def test_key_data(self):
+        from pesummary.core.cli.inputs import load_current_state
+
+        assert self.inputs.key_data is self.inputs.key_data
+        for param in self.parameters:
+            assert self.inputs.key_data["example"][param]["maxL"] == \
+                self.inputs.maxL_samples["example"][param]
+        state = load_current_state(self.inputs._resume_file_path)
+        assert state._key_data.keys() == self.inputs.key_data.keys()
+
     def test_same_parameters(self):
         parser = ArgumentParser()
         parser.add_all_known_options_to_parser()
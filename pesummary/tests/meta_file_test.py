@@ -225,7 +225,25 @@ def test_softlinks():
                     f["label1"]["psds"]["H1"][1], f["label1"]["psds"]["L1"][1]
                 )
             )
-     
+
+
+def test_softlinks_large_arrays():
+    """Test that large arrays which only differ in the middle are not
+    replaced by softlinks
+    """
+    array = np.zeros(10000)
+    different = array.copy()
+    different[5000] = 1.
+    data = {
+        "label1": {"psd": array, "calibration": array.copy()},
+        "label2": {"psd": different}
+    }
+    simlinked_dict = _GWMetaFile._create_softlinks(data)
+    assert isinstance(simlinked_dict["label1"]["psd"], np.ndarray)
+    assert simlinked_dict["label1"]["calibration"] == "softlink:/label1/psd"
+    assert isinstance(simlinked_dict["label2"]["psd"], np.ndarray)
+    assert isinstance(data["label1"]["calibration"], np.ndarray)
+
 
 class TestMetaFile(object):
     """Class the test the pesummary.gw.file.meta_file._GWMetaFile class
@@ -365,6 +365,25 @@ class TestCoreHDF5File(BaseRead):
         true = {par: float("nan") for par in self.parameters}
         super(TestCoreHDF5File, self).test_injection_parameters(true)
 
+    def test_memory_mapped_dataset(self):
+        """Test that contiguous datasets are memory mapped and that the data
+        is identical to a compressed dataset
+        """
+        import h5py
+        from pesummary.core.file.formats.hdf5 import _read_dataset
+
+        data = np.random.uniform(10, 0.5, (100, 3))
+        with h5py.File(os.path.join(tmpdir, "mmap.h5"), "w") as f:
+            f.create_dataset("contiguous", data=data)
+            f.create_dataset("compressed", data=data, compression="gzip")
+        with h5py.File(os.path.join(tmpdir, "mmap.h5"), "r") as f:
+            contiguous = _read_dataset(f["contiguous"])
+            compressed = _read_dataset(f["compressed"])
+        assert isinstance(contiguous, np.memmap)
+        assert not isinstance(compressed, np.memmap)
+        np.testing.assert_almost_equal(contiguous, data)
+        np.testing.assert_almost_equal(compressed, data)
+
     def test_to_dat(self):
         """Test the to_dat method
         """
@@ -2164,3 +2183,37 @@ def test_add_log_likelihood():
     )
     if os.path.isdir(tmpdir):
         shutil.rmtree(tmpdir)
+
+
+def test_load_subset_of_analyses():
+    """Test that only the requested analyses are loaded from a PESummary
+    metafile
+    """
+    from pesummary.utils.samples_dict import MultiAnalysisSamplesDict
+
+    if not os.path.isdir(tmpdir):
+        os.mkdir(tmpdir)
+    data = MultiAnalysisSamplesDict({
+        "one": {
+            "a": np.random.uniform(1, 5, 1000), "b": np.random.uniform(1, 2, 1000)
+        }, "two": {
+            "c": np.random.uniform(1, 5, 1000), "d": np.random.uniform(1, 2, 1000)
+        }, "three": {
+            "e": np.random.uniform(1, 5, 1000), "f": np.random.uniform(1, 2, 1000)
+        }
+    })
+    write(data, file_format="pesummary", filename="multi.h5", outdir=tmpdir)
+    f = read("{}/multi.h5".format(tmpdir))
+    assert sorted(f.labels) == ["one", "three", "two"]
+    f = read("{}/multi.h5".format(tmpdir), labels=["three", "one"])
+    assert sorted(f.labels) == ["one", "three"]
+    _samples_dict = f.samples_dict
+    for label in ["one", "three"]:
+        for param in data[label].keys():
+            np.testing.assert_almost_equal(
+                _samples_dict[label][param], data[label][param]
+            )
+    f = GWRead("{}/multi.h5".format(tmpdir), labels=["two"])
+    assert f.labels == ["two"]
+    if os.path.isdir(tmpdir):
+        shutil.rmtree(tmpdir)
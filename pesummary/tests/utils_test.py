@@ -377,6 +377,22 @@ class TestSamplesDict(object):
         for old, new in mapping.items():
             np.testing.assert_almost_equal(dictionary[old], new_dict[new])
 
+    def test_to_structured_array(self):
+        """Test the to_structured_array method
+        """
+        dataset = SamplesDict(self.parameters, self.samples)
+        array = dataset.to_structured_array()
+        assert array.dtype.names == tuple(self.parameters)
+        assert all(array.dtype[param] == np.float64 for param in self.parameters)
+        for num, param in enumerate(self.parameters):
+            np.testing.assert_almost_equal(array[param], self.samples[num])
+        array = dataset.to_structured_array(dtype=np.float32)
+        assert all(array.dtype[param] == np.float32 for param in self.parameters)
+        for num, param in enumerate(self.parameters):
+            np.testing.assert_almost_equal(
+                array[param], self.samples[num], decimal=4
+            )
+
     def test_waveforms(self):
         """Test the waveform generation
         """
@@ -1,5 +1,6 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
+import json
 import os
 import socket
 import shutil
@@ -86,6 +87,13 @@ class TestPage(object):
         f = self.open_and_read("{}/home.html".format(tmpdir))
         assert any(elem == "  testing\n" for elem in f) == True
 
+    def test_add_list_of_content(self):
+        content = ["testing", "list\n"]
+        self.html.add_content(content, indent=2)
+        self.html.close()
+        f = self.open_and_read("{}/home.html".format(tmpdir))
+        assert f[-2:] == ["  testing\n", "  list\n"]
+
     def test_header(self):
         self.html.make_header(approximant="approx")
         self.html.close()
@@ -310,3 +318,107 @@ class TestWebpage(object):
                 except ValueError:
                     assert _key_data[row[0]][header] is None
                     assert row[num + 1] == 'None'
+
+    def test_multi_process(self):
+        """Test that the same webpages are produced when the 1d histogram
+        pages are generated in parallel
+        """
+        from pesummary.gw.webpage.main import _WebpageGeneration
+
+        _tmpdir = tmpdir + "_multi_process"
+        webpage = _WebpageGeneration(
+            webdir=_tmpdir, labels=self.labels, samples=self.samples,
+            pepredicates_probs={label: None for label in self.labels},
+            same_parameters=["chirp_mass", "mass_ratio"], multi_process=2
+        )
+        webpage.generate_webpages()
+        serial = sorted(
+            os.path.basename(_file) for _file in
+            glob(os.path.join(tmpdir, "html", "*.html"))
+        )
+        parallel = sorted(
+            os.path.basename(_file) for _file in
+            glob(os.path.join(_tmpdir, "html", "*.html"))
+        )
+        assert serial == parallel
+        for label in self.labels:
+            for param in ["chirp_mass", "mass_ratio"]:
+                _file = "{}_{}_{}.html".format(label, label, param)
+                with open(os.path.join(tmpdir, "html", _file), "r") as f:
+                    _serial = f.read()
+                with open(os.path.join(_tmpdir, "html", _file), "r") as f:
+                    _parallel = f.read()
+                assert _serial == _parallel
+        shutil.rmtree(_tmpdir)
+
+    def test_checkpoint(self):
+        """Test that the webpages for each parameter are not regenerated when
+        restarting from checkpoint
+        """
+        from pesummary.gw.webpage.main import _WebpageGeneration
+
+        label = self.labels[0]
+        _file = os.path.join(
+            tmpdir, "html", "{}_{}_chirp_mass.html".format(label, label)
+        )
+        _other = os.path.join(
+            tmpdir, "html", "{}_{}_mass_ratio.html".format(label, label)
+        )
+        _checkpoint = os.path.join(tmpdir, "html", ".done")
+        assert os.path.isfile(_checkpoint)
+        # simulate an interrupted run: the mass_ratio page is only a
+        # skeleton and was never recorded as complete
+        with open(_checkpoint, "r") as f:
+            lines = [
+                line for line in f if json.loads(line)[:2] != [
+                    label, "mass_ratio"
+                ]
+            ]
+        with open(_checkpoint, "w") as f:
+            f.writelines(lines)
+        for path in [_file, _other]:
+            with open(path, "w") as f:
+                f.write("checkpoint")
+
+        def generate(samples):
+            labels = list(samples.keys())
+            webpage = _WebpageGeneration(
+                webdir=tmpdir, labels=labels, samples=samples,
+                pepredicates_probs={label: None for label in labels},
+                same_parameters=["chirp_mass", "mass_ratio"], checkpoint=True
+            )
+            webpage.generate_webpages()
+
+        generate(self.samples)
+        with open(_file, "r") as f:
+            assert f.read() == "checkpoint"
+        with open(_other, "r") as f:
+            assert f.read() != "checkpoint"
+        # pages must be regenerated if the samples have changed
+        with open(_file, "w") as f:
+            f.write("checkpoint")
+        samples = MultiAnalysisSamplesDict({
+            _label: {
+                param: np.random.uniform(0.2, 1.0, 1000) for param in
+                ["chirp_mass", "mass_ratio"]
+            } for _label in self.labels
+        })
+        generate(samples)
+        with open(_file, "r") as f:
+            assert f.read() != "checkpoint"
+        # pages must be regenerated if a label is added because the navbar
+        # changes
+        with open(_file, "w") as f:
+            f.write("checkpoint")
+        samples = MultiAnalysisSamplesDict({
+            _label: {
+                param: samples[_label][param] for param in
+                ["chirp_mass", "mass_ratio"]
+            } if _label in self.labels else {
+                param: np.random.uniform(0.2, 1.0, 1000) for param in
+                ["chirp_mass", "mass_ratio"]
+            } for _label in self.labels + ["three"]
+        })
+        generate(samples)
+        with open(_file, "r") as f:
+            assert f.read() != "checkpoint"
@@ -231,9 +231,29 @@ class Array(np.ndarray):
                     return _dtype(array)
             return array
 
+        # compute all of the requested percentiles with a single sort (or
+        # partition) of the array rather than one per percentile. The
+        # unweighted median is left to np.median
+        _percentiles = {"5th percentile": 5, "95th percentile": 95}
+        if getattr(array, "weights", None) is not None:
+            _percentiles["median"] = 50
+        _required = [key for key in _percentiles.keys() if key in header]
+        _cached = {}
+        if len(_required) and hasattr(array, "confidence_interval"):
+            _values = Array.percentile(
+                array, weights=array.weights,
+                percentile=[_percentiles[key] for key in _required]
+            )
+            _cached = {
+                key: safe_dtype_change(_values[num], float) for num, key in
+                enumerate(_required)
+            }
+
         mydict = {}
         for key in header:
-            if not hasattr(np.ndarray, key):
+            if key in _cached.keys():
+                _value = _cached[key]
+            elif not hasattr(np.ndarray, key):
                 try:
                     _value = safe_dtype_change(getattr(array, key), float)
                 except AttributeError:
@@ -324,11 +324,18 @@ class SamplesDict(Dict):
 
         return DataFrame(self, **kwargs)
 
-    def to_structured_array(self, **kwargs):
+    def to_structured_array(self, dtype=float, **kwargs):
         """Convert a SamplesDict object to a structured numpy array
+
+        Parameters
+        ----------
+        dtype: type, optional
+            data type to use for each column. Default float
+        **kwargs: dict, optional
+            all additional kwargs are passed to the to_pandas method
         """
         return self.to_pandas(**kwargs).to_records(
-            index=False, column_dtypes=float
+            index=False, column_dtypes=dtype
         )
 
     def pop(self, parameter):
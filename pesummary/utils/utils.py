@@ -6,6 +6,7 @@ import logging
 import contextlib
 import time
 import copy
+import functools
 import shutil
 
 import numpy as np
@@ -209,12 +210,21 @@ def command_line_dict():
     return vars(opts)
 
 
-def gw_results_file(opts):
-    """Determine if a GW results file is passed
+@functools.lru_cache(maxsize=1)
+def _gw_options():
+    """Return the destinations and defaults of all GW specific command line
+    options. These are fixed so the parsers only need to be built once
     """
     from pesummary.gw.cli.parser import ArgumentParser
 
     attrs, defaults = ArgumentParser().gw_options
+    return tuple(attrs), tuple(defaults)
+
+
+def gw_results_file(opts):
+    """Determine if a GW results file is passed
+    """
+    attrs, defaults = _gw_options()
     condition = any(
         hasattr(opts, attr) and getattr(opts, attr) and getattr(opts, attr)
         != default for attr, default in zip(attrs, defaults)
@@ -239,11 +249,12 @@ def functions(opts, gw=False):
     from pesummary.core.finish import FinishingTouches
     from pesummary.gw.finish import GWFinishingTouches
 
+    gw = gw or gw_results_file(opts)
     dictionary = {}
-    dictionary["input"] = GWInput if gw_results_file(opts) or gw else Input
-    dictionary["MetaFile"] = GWMetaFile if gw_results_file(opts) or gw else MetaFile
+    dictionary["input"] = GWInput if gw else Input
+    dictionary["MetaFile"] = GWMetaFile if gw else MetaFile
     dictionary["FinishingTouches"] = \
-        GWFinishingTouches if gw_results_file(opts) or gw else FinishingTouches
+        GWFinishingTouches if gw else FinishingTouches
     return dictionary
 
 